@@ -119,7 +119,13 @@ class PageProcessor(ABC, ctk.CTkFrame):
         _ = args
         value = var_value.get()
 
-        setattr(self.data_models, var_name, value)
+        try:
+            setattr(self.data_models, var_name, value)
+        except ValueError as error:
+            # Trace callbacks swallow exceptions, so report the rejected input rather than silently keeping
+            # the previous value.
+            logger.error("Invalid value %r for %s: %s", value, var_name, error)
+            self.display_result(f"Invalid value for {var_name.replace('_', ' ')}: {value}")
 
     def execute_task(self, run_type, model_type):
         """
@@ -669,7 +675,7 @@ class PageProcessor(ABC, ctk.CTkFrame):
             monte_carlo_frame, textvariable=num_simulations_var
         ).grid(row=monte_carlo_frame_rows, column=3, sticky="w", padx=5, pady=y_padding)
         num_simulations_var.trace_add(
-            "write", lambda *args: self.update_models_data("num_simulation", num_simulations_var)
+            "write", lambda *args: self.update_models_data("num_simulations", num_simulations_var)
         )
         monte_carlo_frame_rows += 1
         ctk.CTkLabel(
@@ -7,6 +7,7 @@ import logging
 from datetime import datetime
 from abc import ABC, abstractmethod
 
+import numpy as np
 import pandas as pd
 
 import strategy_analyzer.utilities as utilities
@@ -19,6 +20,9 @@ from strategy_analyzer.results.backtest_results_processor import BacktestResults
 
 logger = logging.getLogger(__name__)
 
+_FRAME_CACHE = {}
+_FRAME_CACHE_SIZE = 8
+
 
 class BacktestingProcessor(ABC):
     """
@@ -29,6 +33,11 @@ class BacktestingProcessor(ABC):
         self.data_portfolio = portfolio_data
         self.results_models = models_results
         self.adjusted_start_date = None
+        self._frame_cache = {}
+        self._below_cache = {}
+        self._weight_cache = {}
+        self._last_replacement = None
+        self._weights_by_date = {}
 
     def process(self):
         """
@@ -50,6 +59,16 @@ class BacktestingProcessor(ABC):
         Abstract method to encapsulate monthly asset selection.
         """
 
+    def precompute_weights(self, rebalance_dates: list):
+        """
+        Hook for processors that can compute the weights of every rebalance date up front.
+
+        Parameters
+        ----------
+        rebalance_dates : list
+            Trading dates on which the portfolio is rebalanced.
+        """
+
     @abstractmethod
     def calculate_momentum(self, current_date: datetime.date) -> float:
         """
@@ -92,6 +111,216 @@ class BacktestingProcessor(ABC):
             Dictionary of adjusted asset weights.
         """
 
+    def is_below_ma(self, ticker: str, data: pd.DataFrame, current_date: datetime) -> bool:
+        """
+        Checks if the price of the given ticker is below its moving average.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker to check.
+        data : DataFrame
+            The DataFrame containing the ticker's data.
+        current_date : datetime
+            The current date for which the check is performed.
+
+        Returns
+        -------
+        bool
+            True if the price is below the moving average, False otherwise.
+        """
+        _, col_of, _, _ = self._get_frame_arrays(data=data)
+        below = self._get_below_matrix(data=data, period=self.data_models.ma_window)
+
+        return utilities.is_below_ma(below, self._get_row(data=data, current_date=current_date), col_of[ticker])
+
+    def get_replacement_asset(self, current_date: datetime) -> str:
+        """
+        Determines the replacement asset (cash or bond) based on the moving average (MA) threshold.
+
+        Parameters
+        ----------
+        current_date : datetime
+            The current date for which to evaluate the MA condition.
+
+        Returns
+        -------
+        str or None
+            The replacement asset ticker, either a bond or cash ticker. Returns None if no valid replacement asset is found.
+        """
+        bond_ticker = self.data_models.bond_ticker
+        bond_above_ma = (
+            bool(bond_ticker)
+            and self.has_ticker(ticker=bond_ticker, data=self.data_portfolio.bond_data)
+            and not self.is_below_ma(ticker=bond_ticker, data=self.data_portfolio.bond_data, current_date=current_date)
+        )
+
+        return utilities.pick_replacement_asset(bond_ticker, bond_above_ma, self.data_models.cash_ticker)
+
+    def has_ticker(self, ticker: str, data: pd.DataFrame) -> bool:
+        """
+        Checks if the given ticker is a column of data.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker to look up.
+        data : DataFrame
+            The DataFrame to search.
+
+        Returns
+        -------
+        bool
+            True if data holds prices for the ticker, False otherwise.
+        """
+        _, col_of, _, _ = self._get_frame_arrays(data=data)
+
+        return ticker in col_of
+
+    def replace_assets(
+            self, replace_row: np.ndarray, data: pd.DataFrame, replacement_asset: str, weights: dict=None
+    ) -> dict:
+        """
+        Moves the weight of the flagged assets into the replacement asset and normalizes the weights.
+
+        Parameters
+        ----------
+        replace_row : ndarray
+            Boolean flags aligned to the columns of data, True where the asset is replaced.
+        data : DataFrame
+            The DataFrame whose columns replace_row refers to.
+        replacement_asset : str or None
+            The ticker receiving the weight of replaced assets. Nothing is replaced if empty.
+        weights : dict or None
+            Optional weights to adjust. If None, uses `self.data_models.assets_weights`.
+
+        Returns
+        -------
+        dict
+            Dictionary of adjusted asset weights.
+        """
+        if weights is None and self._last_replacement is not None:
+            last_data_id, last_replacement_asset, last_row, last_weights = self._last_replacement
+            if (
+                last_data_id == id(data)
+                and last_replacement_asset == replacement_asset
+                and np.array_equal(last_row, replace_row)
+            ):
+                return last_weights.copy()
+
+        tickers, asset_cols, values, replacement_idx = self._get_weight_arrays(
+            data=data, replacement_asset=replacement_asset, weights=weights
+        )
+        values, replaced = utilities.apply_ma_replacement(replace_row, asset_cols, values, replacement_idx)
+        num_tickers = len(tickers) if replaced else len(asset_cols)
+        adjusted_weights = dict(zip(tickers[:num_tickers], values.tolist()))
+
+        if weights is None:
+            self._last_replacement = (id(data), replacement_asset, replace_row, adjusted_weights.copy())
+
+        return adjusted_weights
+
+    def _get_weight_arrays(self, data: pd.DataFrame, replacement_asset: str, weights: dict=None) -> tuple:
+        """
+        Returns the tickers, data columns, weights array and replacement position for the given weights.
+
+        The arrays for the configured portfolio weights are built once per data frame and replacement asset.
+        """
+        key = (id(data), replacement_asset)
+        if weights is None and key in self._weight_cache:
+            return self._weight_cache[key]
+
+        source = self.data_models.assets_weights if weights is None else weights
+        _, col_of, _, _ = self._get_frame_arrays(data=data)
+        tickers = list(source)
+        values = list(source.values())
+        asset_cols = np.fromiter((col_of.get(ticker, -1) for ticker in tickers), dtype=np.int32, count=len(tickers))
+        replacement_idx = -1
+        if replacement_asset:
+            if replacement_asset not in source:
+                tickers.append(replacement_asset)
+                values.append(0.0)
+            replacement_idx = tickers.index(replacement_asset)
+
+        arrays = (tickers, asset_cols, np.asarray(values, dtype=np.float64), replacement_idx)
+        if weights is None:
+            self._weight_cache[key] = arrays
+
+        return arrays
+
+    def _get_row(self, data: pd.DataFrame, current_date: datetime) -> int:
+        """
+        Returns the row of data holding the last prices on or before current_date.
+
+        Parameters
+        ----------
+        data : DataFrame
+            The DataFrame to look up.
+        current_date : datetime
+            The current date.
+
+        Returns
+        -------
+        int
+            Integer row position in data.
+        """
+        row_of, _, _, dates_i8 = self._get_frame_arrays(data=data)
+        row = row_of.get(current_date)
+        if row is None:
+            row = int(np.searchsorted(dates_i8, np.datetime64(current_date, "ns").view("i8"), side="right")) - 1
+            if row < 0:
+                raise ValueError(f"No data on or before {current_date}.")
+
+        return row
+
+    def _get_frame_arrays(self, data: pd.DataFrame) -> tuple:
+        """
+        Returns the date to row map, ticker to column map, price array and int64 dates of data.
+
+        The arrays are built once per frame and shared by every processor backtesting it, so a parameter
+        sweep only pays for them once per worker.
+        """
+        key = id(data)
+        cached = self._frame_cache.get(key)
+        if cached is None:
+            shared = _FRAME_CACHE.get(key)
+            if shared is None or shared[0] is not data:
+                if len(_FRAME_CACHE) >= _FRAME_CACHE_SIZE:
+                    del _FRAME_CACHE[next(iter(_FRAME_CACHE))]
+                shared = _FRAME_CACHE[key] = (
+                    data,
+                    (
+                        {date: row for row, date in enumerate(data.index)},
+                        {ticker: col for col, ticker in enumerate(data.columns)},
+                        data.to_numpy(dtype=np.float32),
+                        pd.DatetimeIndex(data.index).to_numpy(dtype="datetime64[ns]").view("i8"),
+                    ),
+                )
+            cached = self._frame_cache[key] = shared[1]
+
+        return cached
+
+    def _get_below_matrix(self, data: pd.DataFrame, period: int) -> np.ndarray:
+        """
+        Returns whether each price of data is below its moving average, computed once per backtest.
+        """
+        key = (id(data), period)
+        if key not in self._below_cache:
+            _, _, prices, _ = self._get_frame_arrays(data=data)
+            self._below_cache[key] = prices < self._get_moving_average(data=data, period=period)
+
+        return self._below_cache[key]
+
+    def _get_moving_average(self, data: pd.DataFrame, period: int) -> np.ndarray:
+        """
+        Returns the full-series moving average of data, computing it once per frame and period.
+
+        The moving average at a date only depends on prices up to that date, so a single pass over the
+        whole frame gives the same values as recomputing on every date's prefix. The result is shared by
+        every processor backtesting the same frame.
+        """
+        return utilities.precompute_ma(data=data, ma_type=self.data_models.ma_type, window=period)
+
     def run_backtest(self):
         """
         Runs the backtest by calculating portfolio values and returns over time.
@@ -107,9 +336,13 @@ class BacktestingProcessor(ABC):
         tax_adjusted_values = [int(self.data_models.initial_portfolio_value)]
         all_adjusted_weights = []
 
+        rebalance_dates = [
+            self._get_last_trading_date(monthly_dates[i]) for i in range(0, len(monthly_dates), step)
+        ]
+        self.precompute_weights(rebalance_dates=rebalance_dates)
+
         for i in range(0, len(monthly_dates), step):
-            current_date = monthly_dates[i]
-            last_date_current_month = self._get_last_trading_date(current_date)
+            last_date_current_month = rebalance_dates[i // step]
 
             adjusted_weights = self.get_portfolio_assets_and_weights(current_date=last_date_current_month)
 
@@ -262,22 +495,16 @@ class BacktestingProcessor(ABC):
         """
         Calculates and sets portfolio statistics.
         """
-        self.results_models.cagr = utilities.calculate_cagr(
-            portfolio_value=self.results_models.portfolio_values_non_con
-        )
-        self.results_models.average_annual_return = utilities.calculate_average_annual_return(
-            returns=self.results_models.portfolio_returns
-        )
-        self.results_models.max_drawdown = utilities.calculate_max_drawdown(
-            portfolio_value=self.results_models.portfolio_values_non_con
-        )
-        self.results_models.var, self.results_models.cvar = utilities.calculate_var_cvar(
-            returns=self.results_models.portfolio_returns
-        )
-        self.results_models.annual_volatility = utilities.calculate_annual_volatility(
-            portfolio_returns=self.results_models.portfolio_returns
-        )
-        self.results_models.standard_deviation = utilities.calculate_standard_deviation(
+        (
+            self.results_models.cagr,
+            self.results_models.average_annual_return,
+            self.results_models.max_drawdown,
+            self.results_models.var,
+            self.results_models.cvar,
+            self.results_models.annual_volatility,
+            self.results_models.standard_deviation,
+        ) = utilities.calculate_portfolio_statistics(
+            portfolio_value=self.results_models.portfolio_values_non_con,
             returns=self.results_models.portfolio_returns
         )
 
@@ -3,7 +3,6 @@ import logging
 import pandas as pd
 from scipy.cluster.hierarchy import linkage, fcluster
 from scipy.spatial.distance import pdist, squareform
-import strategy_analyzer.utilities as utilities
 from strategy_analyzer.logger import logger
 from strategy_analyzer.data.portfolio_data import PortfolioData
 from strategy_analyzer.models.models_data import ModelsData
@@ -73,7 +72,7 @@ class HierarchicalClusteringBacktestProcessor(BacktestingProcessor):
         """
         Calculate average momentum based on 3, 6, 9, and 12-month cumulative returns.
         """
-        momentum_data = self.data_portfolio.assets_data.copy().pct_change().dropna()
+        momentum_data = self.data_portfolio.assets_data.pct_change().dropna()
         momentum_3m = (momentum_data.loc[:current_date].iloc[-63:] + 1).prod() - 1
         momentum_6m = (momentum_data.loc[:current_date].iloc[-126:] + 1).prod() - 1
         momentum_9m = (momentum_data.loc[:current_date].iloc[-189:] + 1).prod() - 1
@@ -84,30 +83,16 @@ class HierarchicalClusteringBacktestProcessor(BacktestingProcessor):
         """
         Adjusts the weights of the clustered assets based on SMA.
         """
-        def get_replacement_asset():
-            """ Helper function to get replacement asset based on SMA. """
-            if self.data_models.bond_ticker and not utilities.is_below_ma(
-                current_date=current_date,
-                ticker=self.data_models.bond_ticker,
-                data=self.data_portfolio.bond_data,
-                ma_type=self.data_models.ma_type,
-                ma_window=self.data_models.ma_window,
-            ):
-                return self.data_models.bond_ticker
-            return self.data_models.cash_ticker
-
+        replacement_asset = self.get_replacement_asset(current_date=current_date)
         adjusted_weights = {}
         total_weight = 0
 
         for asset in selected_assets.columns:
-            if utilities.is_below_ma(
-                current_date=current_date,
+            if self.is_below_ma(
                 ticker=asset,
                 data=self.data_portfolio.assets_data,
-                ma_type=self.data_models.ma_type,
-                ma_window=self.data_models.ma_window,
+                current_date=current_date,
             ):
-                replacement_asset = get_replacement_asset()
                 if replacement_asset:
                     adjusted_weights[replacement_asset] = adjusted_weights.get(replacement_asset, 0) + 1
             else:
@@ -7,6 +7,7 @@ import logging
 
 import pandas as pd
 
+import strategy_analyzer.utilities as utilities
 from strategy_analyzer.logger import logger
 from strategy_analyzer.models.models_data import ModelsData
 from strategy_analyzer.data.portfolio_data import PortfolioData
@@ -37,14 +38,8 @@ class IAOMomentumBacktestProcessor(BacktestingProcessor):
         """
         """
         in_market_momentum, out_of_market_momentum = self.calculate_momentum(current_date=current_date)
-        selected_assets = pd.DataFrame({
-            'Asset': in_market_momentum.nlargest(self.data_models.num_assets_to_select).index,
-            'Momentum': in_market_momentum.nlargest(self.data_models.num_assets_to_select).values
-        })
-        selected_out_of_market_asset =pd.DataFrame({
-            'Asset': out_of_market_momentum.nlargest(1).index,
-            'Momentum': out_of_market_momentum.nlargest(1).values
-        })
+        selected_assets = utilities.select_top_assets(in_market_momentum, self.data_models.num_assets_to_select)
+        selected_out_of_market_asset = out_of_market_momentum.idxmax()
 
         adjusted_weights = self.adjust_weights(
             current_date=current_date, selected_assets=selected_assets, selected_out_of_market_asset=selected_out_of_market_asset
@@ -66,14 +61,14 @@ class IAOMomentumBacktestProcessor(BacktestingProcessor):
         tuple
             in_market_momentum and out_of_market_momentum
         """
-        momentum_data = self.data_portfolio.assets_data.copy().pct_change().dropna()
+        momentum_data = self.data_portfolio.assets_data.pct_change().dropna()
         momentum_3m = (momentum_data.loc[:current_date].iloc[-63:] + 1).prod() - 1
         momentum_6m = (momentum_data.loc[:current_date].iloc[-126:] + 1).prod() - 1
         momentum_9m = (momentum_data.loc[:current_date].iloc[-189:] + 1).prod() - 1
         momentum_12m = (momentum_data.loc[:current_date].iloc[-252:] + 1).prod() - 1
         in_market_momentum = (momentum_3m + momentum_6m + momentum_9m + momentum_12m) / 4
 
-        momentum_data_out_of_market = self.data_portfolio.out_of_market_data.copy().pct_change().dropna()
+        momentum_data_out_of_market = self.data_portfolio.out_of_market_data.pct_change().dropna()
         momentum_3m_out = (momentum_data_out_of_market.loc[:current_date].iloc[-63:] + 1).prod() - 1
         momentum_6m_out = (momentum_data_out_of_market.loc[:current_date].iloc[-126:] + 1).prod() - 1
         momentum_9m_out = (momentum_data_out_of_market.loc[:current_date].iloc[-189:] + 1).prod() - 1
@@ -85,8 +80,8 @@ class IAOMomentumBacktestProcessor(BacktestingProcessor):
     def adjust_weights(
             self,
             current_date: datetime,
-            selected_assets: pd.DataFrame =None,
-            selected_out_of_market_asset: pd.DataFrame=None
+            selected_assets: pd.Series=None,
+            selected_out_of_market_asset: str=None
     ) -> dict:
         """
         Adjusts the weights of the assets based on their SMA and the selected weighting strategy.
@@ -95,10 +90,10 @@ class IAOMomentumBacktestProcessor(BacktestingProcessor):
         ----------
         current_date : datetime
             The current date for which the weights are being adjusted.
-        selected_assets : dict or None
-            Optional preselected assets with weights. If None, uses `self.assets_weights`.
-        selected_out_of_market_asset : dict or None
-            Optional out-of-market assets to be used when replacing assets.
+        selected_assets : pd.Series
+            Momentum of the selected in-market assets, indexed by ticker.
+        selected_out_of_market_asset : str
+            Ticker of the out-of-market asset with the highest momentum.
 
         Returns
         -------
@@ -107,66 +102,78 @@ class IAOMomentumBacktestProcessor(BacktestingProcessor):
         """
         adjusted_weights = {}
 
-        def is_below_ma(ticker: str, data: pd.DataFrame) -> bool:
-            """
-            Checks if the asset's price is below its moving average.
-
-            Parameters
-            ----------
-            ticker : str
-                The ticker to check.
-            data : pd.DataFrame
-                Data containing the asset's price history.
-
-            Returns
-            -------
-            bool
-                True if the price is below the moving average, False otherwise.
-            """
-            if ticker not in data.columns:
-                return True
-
-            price = data.loc[:current_date, ticker].iloc[-1]
-
-            if self.data_models.ma_type == "SMA":
-                ma = data.loc[:current_date, ticker].rolling(window=self.data_models.ma_window).mean().iloc[-1]
-            elif self.data_models.ma_type == "EMA":
-                ma = data.loc[:current_date, ticker].ewm(span=self.data_models.ma_window).mean().iloc[-1]
-            else:
-                raise ValueError("Invalid ma_type. Choose 'SMA' or 'EMA'.")
-
-            return price < ma
-
-        def allocate_to_safe_asset(weight: float):
-            """
-            Allocates weights to the selected out-of-market asset if it is above its moving average,
-            otherwise falls back to bonds or cash.
-
-            Parameters
-            ----------
-            weight : float
-                Weight to be allocated.
-            """
-            if not is_below_ma(selected_out_of_market_asset['Asset'].iloc[0], self.data_portfolio.out_of_market_data):
-                adjusted_weights[selected_out_of_market_asset['Asset'].iloc[0]] = adjusted_weights.get(selected_out_of_market_asset['Asset'].iloc[0], 0) + weight
-            elif not is_below_ma(self.data_models.bond_ticker, self.data_portfolio.bond_data):
-                adjusted_weights[self.data_models.bond_ticker] = adjusted_weights.get(self.data_models.bond_ticker, 0) + weight
-            else:
-                adjusted_weights[self.data_models.cash_ticker] = adjusted_weights.get(self.data_models.cash_ticker, 0) + weight
-
-        if self.data_models.ma_threshold_asset and is_below_ma(self.data_models.ma_threshold_asset, self.data_portfolio.ma_threshold_data):
-            allocate_to_safe_asset(1.0)
+        if self.data_models.ma_threshold_asset and self._is_below_ma_or_missing(
+            ticker=self.data_models.ma_threshold_asset, data=self.data_portfolio.ma_threshold_data, current_date=current_date
+        ):
+            safe_asset = self.get_safe_asset(
+                current_date=current_date, selected_out_of_market_asset=selected_out_of_market_asset
+            )
+            adjusted_weights[safe_asset] = 1.0
             return adjusted_weights
 
-        for _, row in selected_assets.iterrows():
-            asset, momentum = row['Asset'], row['Momentum']
-            weight = 1 / len(selected_assets)
-            if self.data_models.negative_mom and momentum <= 0 or is_below_ma(asset, self.data_portfolio.assets_data):
-                allocate_to_safe_asset(weight)
+        # The safe asset is resolved once, and only when an asset actually moves out of the market.
+        safe_asset = None
+        weight = 1 / len(selected_assets)
+        for asset, momentum in zip(selected_assets.index, selected_assets.to_numpy()):
+            if self.data_models.negative_mom and momentum <= 0 or self._is_below_ma_or_missing(
+                ticker=asset, data=self.data_portfolio.assets_data, current_date=current_date
+            ):
+                if safe_asset is None:
+                    safe_asset = self.get_safe_asset(
+                        current_date=current_date, selected_out_of_market_asset=selected_out_of_market_asset
+                    )
+                adjusted_weights[safe_asset] = adjusted_weights.get(safe_asset, 0) + weight
             else:
                 adjusted_weights[asset] = weight
 
-        total_weight = sum(adjusted_weights.values())
-        adjusted_weights = {ticker: weight / total_weight for ticker, weight in adjusted_weights.items()}
+        return utilities.normalize_weights(adjusted_weights)
 
-        return adjusted_weights
+    def get_safe_asset(self, current_date: datetime, selected_out_of_market_asset: str) -> str:
+        """
+        Selects the out-of-market asset if it is above its moving average, otherwise falls back to bonds or cash.
+
+        Parameters
+        ----------
+        current_date : datetime
+            The current date for which to evaluate the MA condition.
+        selected_out_of_market_asset : str
+            Ticker of the out-of-market asset with the highest momentum.
+
+        Returns
+        -------
+        str
+            Ticker receiving the weight of assets moved out of the market.
+        """
+        if not self._is_below_ma_or_missing(
+            ticker=selected_out_of_market_asset, data=self.data_portfolio.out_of_market_data, current_date=current_date
+        ):
+            return selected_out_of_market_asset
+        if not self._is_below_ma_or_missing(
+            ticker=self.data_models.bond_ticker, data=self.data_portfolio.bond_data, current_date=current_date
+        ):
+            return self.data_models.bond_ticker
+        return self.data_models.cash_ticker
+
+    def _is_below_ma_or_missing(self, ticker: str, data: pd.DataFrame, current_date: datetime) -> bool:
+        """
+        Checks if the asset's price is below its moving average, treating assets missing from data as below.
+
+        Parameters
+        ----------
+        ticker : str
+            The ticker to check.
+        data : pd.DataFrame
+            Data containing the asset's price history.
+        current_date : datetime
+            The current date.
+
+        Returns
+        -------
+        bool
+            True if the price is below the moving average or the ticker is missing, False otherwise.
+        """
+        # Unconfigured frames (e.g. bond_data without a bond ticker) are left as the DataFrame class itself.
+        if not isinstance(data, pd.DataFrame) or not self.has_ticker(ticker=ticker, data=data):
+            return True
+
+        return self.is_below_ma(ticker=ticker, data=data, current_date=current_date)
@@ -39,15 +39,11 @@ class MomentumBacktestProcessor(BacktestingProcessor):
         If an asset has momentum greater than 1.0, replace it with a fallback asset.
         """
         momentum = self.calculate_momentum(current_date=current_date)
+        selected_assets = utilities.select_top_assets(momentum, self.data_models.num_assets_to_select)
 
-        selected_assets = pd.DataFrame({
-            'Asset': momentum.nlargest(self.data_models.num_assets_to_select).index,
-            'Momentum': momentum.nlargest(self.data_models.num_assets_to_select).values
-        })
-        print(selected_assets)
         adjusted_weights = self.adjust_weights(current_date=current_date, selected_assets=selected_assets)
         adjusted_weights = utilities.calculate_conditional_value_at_risk_weighting(
-            returns_df=self.data_portfolio.assets_data.copy().pct_change().dropna(),
+            returns_df=self.data_portfolio.assets_data.pct_change().dropna(),
             weights=adjusted_weights,
             confidence_level=0.95,
             cash_ticker=self.data_models.cash_ticker,
@@ -70,7 +66,7 @@ class MomentumBacktestProcessor(BacktestingProcessor):
         pd.Series
             Series of momentum values for each asset.
         """
-        momentum_data = self.data_portfolio.assets_data.copy().pct_change().dropna()
+        momentum_data = self.data_portfolio.assets_data.pct_change().dropna()
         momentum_1m = (momentum_data.loc[:current_date].iloc[-21:] + 1).prod() - 1
         momentum_3m = (momentum_data.loc[:current_date].iloc[-63:] + 1).prod() - 1
         momentum_6m = (momentum_data.loc[:current_date].iloc[-126:] + 1).prod() - 1
@@ -103,7 +99,7 @@ class MomentumBacktestProcessor(BacktestingProcessor):
     def adjust_weights(
             self,
             current_date: datetime,
-            selected_assets: pd.DataFrame=None,
+            selected_assets: pd.Series=None,
             selected_out_of_market_assets: pd.DataFrame=None
     ) -> dict:
         """
@@ -113,8 +109,8 @@ class MomentumBacktestProcessor(BacktestingProcessor):
         ----------
         current_date : datetime
             The current date for which the weights are being adjusted.
-        selected_assets : dict or None
-            Optional preselected assets with weights. If None, uses `self.assets_weights`.
+        selected_assets : pd.Series
+            Momentum of the selected assets, indexed by ticker.
         selected_out_of_market_assets : dict or None
             Optional out-of-market assets to be used when replacing assets.
 
@@ -123,74 +119,31 @@ class MomentumBacktestProcessor(BacktestingProcessor):
         dict
             Dictionary of adjusted asset weights.
         """
-        def get_replacement_asset(current_date):
-            """
-            Determines the replacement asset (cash or bond) based on the moving average (MA) threshold.
-
-            Parameters
-            ----------
-            current_date : datetime
-                The current date for which to evaluate the MA condition.
-
-            Returns
-            -------
-            str or None
-                The replacement asset ticker, either a bond or cash ticker. Returns None if no valid replacement asset is found.
-            """
-            if (
-                self.data_models.bond_ticker
-                and self.data_models.bond_ticker in self.data_portfolio.bond_data.columns
-            ):
-                if not utilities.is_below_ma(
-                    current_date=current_date,
-                    ticker=self.data_models.bond_ticker,
-                    data=self.data_portfolio.bond_data,
-                    ma_type=self.data_models.ma_type,
-                    ma_window=self.data_models.ma_window,
-                ):
-                    return self.data_models.bond_ticker
-
-            return self.data_models.cash_ticker
+        replacement_asset = self.get_replacement_asset(current_date=current_date)
 
         if self.data_models.ma_threshold_asset:
-            if utilities.is_below_ma(
-                current_date=current_date,
+            if self.is_below_ma(
                 ticker=self.data_models.ma_threshold_asset,
                 data=self.data_portfolio.ma_threshold_data,
-                ma_type=self.data_models.ma_type,
-                ma_window=self.data_models.ma_window,
+                current_date=current_date,
             ):
-                replacement_asset = get_replacement_asset(current_date=current_date)
                 if replacement_asset:
                     return {replacement_asset: 1.0}
 
         adjusted_weights = {}
-        total_weight = 0
-
-        for _, row in selected_assets.iterrows():
-            asset = row['Asset']
-            momentum = row['Momentum']
 
+        for asset, momentum in zip(selected_assets.index, selected_assets.to_numpy()):
             if (
                 (self.data_models.negative_mom and momentum <= 0)
-                or utilities.is_below_ma(
-                    current_date=current_date,
+                or self.is_below_ma(
                     ticker=asset,
                     data=self.data_portfolio.assets_data,
-                    ma_type=self.data_models.ma_type,
-                    ma_window=self.data_models.ma_window,
+                    current_date=current_date,
                 )
             ):
-                replacement_asset = get_replacement_asset(current_date=current_date)
                 if replacement_asset:
                     adjusted_weights[replacement_asset] = adjusted_weights.get(replacement_asset, 0) + 1
             else:
                 adjusted_weights[asset] = adjusted_weights.get(asset, 0) + 1
 
-            total_weight += 1
-
-        adjusted_weights = {
-            ticker: weight / total_weight for ticker, weight in adjusted_weights.items()
-        }
-
-        return adjusted_weights
+        return utilities.normalize_weights(adjusted_weights, total=len(selected_assets))
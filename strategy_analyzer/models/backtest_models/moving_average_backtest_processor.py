@@ -5,6 +5,7 @@ Backtesting processor module.
 import datetime
 import logging
 
+import numpy as np
 import pandas as pd
 
 import strategy_analyzer.utilities as utilities
@@ -35,10 +36,117 @@ class MovingAverageBacktestProcessor(BacktestingProcessor):
     def get_portfolio_assets_and_weights(self, current_date):
         """
         """
-        adjusted_weights = self.adjust_weights(current_date=current_date)
+        return self._weights_by_date[current_date]
+
+    def precompute_weights(self, rebalance_dates: list):
+        """
+        Computes the adjusted weights of every rebalance date in one pass.
+
+        Parameters
+        ----------
+        rebalance_dates : list
+            Trading dates on which the portfolio is rebalanced.
+        """
+        self._weights_by_date = dict(zip(rebalance_dates, self.vectorized_adjust_weights_all(rebalance_dates)))
+
+    def vectorized_adjust_weights_all(self, rebalance_dates: list) -> list:
+        """
+        Adjusts the weights of the assets for every rebalance date at once.
+
+        The below-MA flags, replacement assets and threshold signals of all dates are gathered into
+        arrays and the replaced weights are scattered into a dates x tickers matrix with a single
+        np.add.at, giving the same weights as calling adjust_weights on each date.
+
+        Parameters
+        ----------
+        rebalance_dates : list
+            Trading dates on which the portfolio is rebalanced.
+
+        Returns
+        -------
+        list
+            Dictionary of adjusted asset weights for each rebalance date.
+        """
+        assets_data = self.data_portfolio.assets_data
+        bond_ticker = self.data_models.bond_ticker
+        cash_ticker = self.data_models.cash_ticker
+
+        use_bond = np.zeros(len(rebalance_dates), dtype=bool)
+        if bond_ticker and self.has_ticker(ticker=bond_ticker, data=self.data_portfolio.bond_data):
+            use_bond = ~self._below_on_dates(
+                ticker=bond_ticker, data=self.data_portfolio.bond_data, dates=rebalance_dates
+            )
+        replacements = [utilities.pick_replacement_asset(bond_ticker, bond_ok, cash_ticker) for bond_ok in use_bond]
+
+        threshold = np.zeros(len(rebalance_dates), dtype=bool)
+        if self.data_models.ma_threshold_asset:
+            threshold = self._below_on_dates(
+                ticker=self.data_models.ma_threshold_asset,
+                data=self.data_portfolio.ma_threshold_data,
+                dates=rebalance_dates,
+            )
+
+        tickers, asset_cols, weights, _ = self._get_weight_arrays(data=assets_data, replacement_asset=None)
+        num_assets = len(asset_cols)
+        columns = list(tickers)
+        column_of = {ticker: col for col, ticker in enumerate(columns)}
+        for replacement_asset in set(filter(None, replacements)) - column_of.keys():
+            column_of[replacement_asset] = len(columns)
+            columns.append(replacement_asset)
+        replacement_idx = np.array(
+            [column_of[asset] if asset else -1 for asset in replacements], dtype=np.int32
+        ).reshape(-1, 1)
+
+        rows = np.fromiter(
+            (self._get_row(data=assets_data, current_date=date) for date in rebalance_dates),
+            dtype=np.intp,
+            count=len(rebalance_dates),
+        )
+        below = self._get_below_matrix(data=assets_data, period=self.data_models.ma_window)[rows]
+        has_data = asset_cols >= 0
+        mask = np.zeros((len(rebalance_dates), num_assets), dtype=bool)
+        mask[:, has_data] = below[:, asset_cols[has_data]]
+        mask &= replacement_idx >= 0
+
+        # Zeroing a replaced replacement asset also drops the weight moved into it by earlier assets.
+        positions = np.arange(num_assets)
+        replacement_replaced = np.take_along_axis(
+            mask, np.clip(replacement_idx, 0, max(num_assets - 1, 0)), axis=1
+        ) & (replacement_idx < num_assets)
+        contributions = np.where(mask & (positions <= replacement_idx) & replacement_replaced, 0.0, weights)
+        targets = np.where(mask, replacement_idx, positions)
+
+        adjusted = np.zeros((len(rebalance_dates), len(columns)))
+        date_idx = np.repeat(np.arange(len(rebalance_dates)), num_assets)
+        np.add.at(adjusted, (date_idx, targets.ravel()), contributions.ravel())
+        totals = adjusted.sum(axis=1, keepdims=True)
+        np.divide(adjusted, totals, out=adjusted, where=totals > 0)
+
+        replaced = mask.any(axis=1)
+        adjusted_weights = []
+        for i, replacement_asset in enumerate(replacements):
+            if threshold[i] and replacement_asset:
+                adjusted_weights.append({replacement_asset: 1.0})
+                continue
+
+            date_weights = dict(zip(tickers, adjusted[i, :num_assets].tolist()))
+            if replaced[i] and replacement_idx[i, 0] >= num_assets:
+                date_weights[replacement_asset] = float(adjusted[i, replacement_idx[i, 0]])
+            adjusted_weights.append(date_weights)
 
         return adjusted_weights
 
+    def _below_on_dates(self, ticker: str, data: pd.DataFrame, dates: list) -> np.ndarray:
+        """
+        Returns whether the price of the ticker is below its moving average on each of the dates.
+        """
+        _, col_of, _, _ = self._get_frame_arrays(data=data)
+        rows = np.fromiter(
+            (self._get_row(data=data, current_date=date) for date in dates), dtype=np.intp, count=len(dates)
+        )
+
+        return self._get_below_matrix(data=data, period=self.data_models.ma_window)[rows, col_of[ticker]]
+
     def calculate_momentum(self, current_date: datetime=None):
         pass
 
@@ -65,68 +173,23 @@ class MovingAverageBacktestProcessor(BacktestingProcessor):
         dict
             Dictionary of adjusted asset weights.
         """
-        adjusted_weights = self.data_models.assets_weights.copy() if selected_assets is None else selected_assets.copy()
-
-        def get_replacement_asset(current_date):
-            """
-            Determines the replacement asset (cash or bond) based on the moving average (MA) threshold.
-
-            Parameters
-            ----------
-            current_date : datetime
-                The current date for which to evaluate the MA condition.
-
-            Returns
-            -------
-            str or None
-                The replacement asset ticker, either a bond or cash ticker. Returns None if no valid replacement asset is found.
-            """
-            if (
-                self.data_models.bond_ticker
-                and self.data_models.bond_ticker in self.data_portfolio.bond_data.columns
-            ):
-                if not utilities.is_below_ma(
-                    current_date=current_date,
-                    ticker=self.data_models.bond_ticker,
-                    data=self.data_portfolio.bond_data,
-                    ma_type=self.data_models.ma_type,
-                    ma_window=self.data_models.ma_window,
-                ):
-                    return self.data_models.bond_ticker
-
-            return self.data_models.cash_ticker
+        replacement_asset = self.get_replacement_asset(current_date=current_date)
 
         if self.data_models.ma_threshold_asset:
-            if utilities.is_below_ma(
-                current_date=current_date,
+            if self.is_below_ma(
                 ticker=self.data_models.ma_threshold_asset,
                 data=self.data_portfolio.ma_threshold_data,
-                ma_type=self.data_models.ma_type,
-                ma_window=self.data_models.ma_window,
+                current_date=current_date,
             ):
-                replacement_asset = get_replacement_asset(current_date=current_date)
                 if replacement_asset:
                     return {replacement_asset: 1.0}
 
-        for ticker, weight in list(adjusted_weights.items()):
-            if (
-                ticker in self.data_portfolio.assets_data.columns
-                and utilities.is_below_ma(
-                    current_date=current_date,
-                    ticker=ticker,
-                    data=self.data_portfolio.assets_data,
-                    ma_type=self.data_models.ma_type,
-                    ma_window=self.data_models.ma_window,
-                )
-            ):
-                replacement_asset = get_replacement_asset(current_date=current_date)
-                if replacement_asset:
-                    adjusted_weights[replacement_asset] = adjusted_weights.get(replacement_asset, 0) + weight
-                    adjusted_weights[ticker] = 0
-
-        total_weight = sum(adjusted_weights.values())
-        if total_weight > 0:
-            for ticker in adjusted_weights:
-                adjusted_weights[ticker] /= total_weight
+        below = self._get_below_matrix(data=self.data_portfolio.assets_data, period=self.data_models.ma_window)
+        row = self._get_row(data=self.data_portfolio.assets_data, current_date=current_date)
 
-        return adjusted_weights
+        return self.replace_assets(
+            replace_row=below[row],
+            data=self.data_portfolio.assets_data,
+            replacement_asset=replacement_asset,
+            weights=selected_assets,
+        )
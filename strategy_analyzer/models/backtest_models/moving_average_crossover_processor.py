@@ -5,6 +5,7 @@ Moving Average Crossover Backtesting Processor.
 import logging
 import datetime
 
+import numpy as np
 import pandas as pd
 
 from strategy_analyzer.logger import logger
@@ -33,6 +34,7 @@ class MovingAverageCrossoverProcessor(BacktestingProcessor):
             Portfolio data required for backtesting.
         """
         super().__init__(models_data=models_data, portfolio_data=portfolio_data, models_results=models_results)
+        self._below_slow = None
 
     def get_portfolio_assets_and_weights(self, current_date):
         """
@@ -41,59 +43,31 @@ class MovingAverageCrossoverProcessor(BacktestingProcessor):
 
         return adjusted_weights
 
-    def calculate_momentum(self, current_date: datetime=None):
-        pass
-
-    def calculate_moving_averages(self, data, period):
+    def _get_crossover_matrix(self) -> np.ndarray:
         """
-        Calculates the moving average based on the specified type.
+        Returns whether the fast moving average is not above the slow one for every date and asset.
 
-        Parameters
-        ----------
-        data : DataFrame
-            The DataFrame containing price data.
-        period : int
-            The period for calculating the moving average.
+        Both moving averages are computed once on the full frame, and the matrix is inverted once here
+        so rebalance dates index it directly.
 
         Returns
         -------
-        Series
-            The moving average values.
+        ndarray
+            Boolean matrix aligned to the rows and columns of the assets data, True where the asset is replaced.
         """
-        if self.data_models.ma_type == "SMA":
-            return data.rolling(window=period).mean()
-        elif self.data_models.ma_type == "EMA":
-            return data.ewm(span=period).mean()
-        else:
-            raise ValueError("Invalid ma_type. Choose 'SMA' or 'EMA'.")
-
-    def is_below_ma(self, ticker, data, current_date):
-        """
-        Checks if the price of the given ticker is below its moving average.
+        if self._below_slow is None:
+            fast_ma = self._get_moving_average(
+                data=self.data_portfolio.assets_data, period=self.data_models.fast_ma_period
+            )
+            slow_ma = self._get_moving_average(
+                data=self.data_portfolio.assets_data, period=self.data_models.slow_ma_period
+            )
+            self._below_slow = ~(fast_ma > slow_ma)
 
-        Parameters
-        ----------
-        ticker : str
-            The ticker to check.
-        data : DataFrame
-            The DataFrame containing the ticker's data.
-        current_date : datetime
-            The current date for which the check is performed.
+        return self._below_slow
 
-        Returns
-        -------
-        bool
-            True if the price is below the moving average, False otherwise.
-        """
-        price = data.loc[:current_date, ticker].iloc[-1]
-        if self.data_models.ma_type == "SMA":
-            ma = data.loc[:current_date, ticker].rolling(window=self.data_models.ma_window).mean().iloc[-1]
-        elif self.data_models.ma_type == "EMA":
-            ma = data.loc[:current_date, ticker].ewm(span=self.data_models.ma_window).mean().iloc[-1]
-        else:
-            raise ValueError("Invalid ma_type. Choose 'SMA' or 'EMA'.")
-
-        return price < ma
+    def calculate_momentum(self, current_date: datetime=None):
+        pass
 
     def adjust_weights(
             self, current_date: datetime, selected_assets: pd.DataFrame =None, selected_out_of_market_asset: pd.DataFrame=None
@@ -115,28 +89,22 @@ class MovingAverageCrossoverProcessor(BacktestingProcessor):
         dict
             Dictionary of adjusted asset weights.
         """
-        fast_ma = self.calculate_moving_averages(self.data_portfolio.assets_data.loc[:current_date], self.data_models.fast_ma_period)
-        slow_ma = self.calculate_moving_averages(self.data_portfolio.assets_data.loc[:current_date], self.data_models.slow_ma_period)
-
-        adjusted_weights = self.data_models.assets_weights.copy()
-
-        for ticker, weight in list(adjusted_weights.items()):
-            if fast_ma[ticker].iloc[-1] > slow_ma[ticker].iloc[-1]:
-                adjusted_weights[ticker] = weight
-            else:
-                replacement_asset = None
-                if self.data_models.cash_ticker and self.is_below_ma(self.data_models.cash_ticker, self.data_portfolio.cash_data, current_date):
-                    replacement_asset = self.data_models.cash_ticker
-                elif self.data_models.bond_ticker and self.is_below_ma(self.data_models.bond_ticker, self.data_portfolio.bond_data, current_date):
-                    replacement_asset = self.data_models.bond_ticker
-
-                if replacement_asset:
-                    adjusted_weights[replacement_asset] = adjusted_weights.get(replacement_asset, 0) + weight
-                    adjusted_weights[ticker] = 0
-
-        total_weight = sum(adjusted_weights.values())
-        if total_weight > 0:
-            for ticker in adjusted_weights:
-                adjusted_weights[ticker] /= total_weight
-
-        return adjusted_weights
+        row = self._get_row(data=self.data_portfolio.assets_data, current_date=current_date)
+        replace_row = self._get_crossover_matrix()[row]
+
+        replacement_asset = None
+        if replace_row.any():
+            if self.data_models.cash_ticker and self.is_below_ma(
+                self.data_models.cash_ticker, self.data_portfolio.cash_data, current_date
+            ):
+                replacement_asset = self.data_models.cash_ticker
+            elif self.data_models.bond_ticker and self.is_below_ma(
+                self.data_models.bond_ticker, self.data_portfolio.bond_data, current_date
+            ):
+                replacement_asset = self.data_models.bond_ticker
+
+        return self.replace_assets(
+            replace_row=replace_row,
+            data=self.data_portfolio.assets_data,
+            replacement_asset=replacement_asset,
+        )
@@ -4,12 +4,124 @@ Getter and Setter class for storing environment variables.
 
 from datetime import datetime
 import calendar
+import copy
+import functools
+
+
+def _coerce(value, value_type):
+    """
+    Converts an input value to the given type, leaving empty input unchanged.
+
+    Parameters
+    ----------
+    value : object
+        The raw value, usually a string from the GUI.
+    value_type : type
+        The type to convert to.
+
+    Returns
+    -------
+    object
+        The converted value, or the value itself if it is None or an empty string.
+    """
+    if value is None or value == "":
+        return value
+    return value_type(value)
+
+
+def _coerce_optional(value, value_type):
+    """
+    Converts an input value to the given type, mapping empty input to None.
+
+    Parameters
+    ----------
+    value : object
+        The raw value, usually a string from the GUI.
+    value_type : type
+        The type to convert to.
+
+    Returns
+    -------
+    object
+        The converted value, or None if the value is None or an empty string.
+    """
+    if value is None or value == "":
+        return None
+    return value_type(value)
+
+
+def _coerce_bool(value):
+    """
+    Converts an input value to a bool, parsing the "True"/"False" strings the GUI option menus provide.
+
+    Parameters
+    ----------
+    value : object
+        The raw value, usually a string from the GUI.
+
+    Returns
+    -------
+    object
+        The converted value, or the value itself if it is None or an empty string.
+    """
+    if value is None or value == "":
+        return value
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+CONTRIBUTIONS_PER_YEAR = {"Monthly": 12, "Quarterly": 4, "Yearly": 1}
+
+
+@functools.lru_cache(maxsize=16)
+def _end_of_month(year, month):
+    """
+    Returns the last day of the given month as a YYYY-MM-DD string.
+    """
+    last_day_of_month = calendar.monthrange(year, month)[1]
+    return f"{year:04d}-{month:02d}-{last_day_of_month:02d}"
 
 
 class ModelsData:
     """
     Getter and setter class for storing inputs for models and backtesting.
     """
+    __slots__ = (
+        "_assets_weights",
+        "_bond_ticker",
+        "_cash_ticker",
+        "_end_date",
+        "_initial_portfolio_value",
+        "_num_simulations",
+        "_simulation_horizon",
+        "_ma_window",
+        "_start_date",
+        "_theme_mode",
+        "_trading_frequency",
+        "_weighting_strategy",
+        "_weights_filename",
+        "_max_distance",
+        "_ma_threshold_asset",
+        "_num_assets_to_select",
+        "_out_of_market_tickers",
+        "_processing_type",
+        "_benchmark_asset",
+        "_contribution",
+        "_contribution_frequency",
+        "_return_metric",
+        "_risk_metric",
+        "_risk_tolerance",
+        "_negative_mom",
+        "_ma_type",
+        "_fast_ma_period",
+        "_slow_ma_period",
+        "_use_tax",
+        "_tax_rate",
+        "_discount_to_volatility",
+        "_random_seed",
+    )
+
     def __init__(self):
         """
         Initializes the Config class with default values for portfolio parameters.
@@ -17,12 +129,12 @@ class ModelsData:
         self._assets_weights = {}
         self._bond_ticker = ""
         self._cash_ticker = "SHV"
-        last_day_of_month = calendar.monthrange(datetime.today().year, datetime.today().month)[1]
-        self._end_date = datetime(datetime.today().year, datetime.today().month, last_day_of_month).strftime('%Y-%m-%d')
+        today = datetime.today()
+        self._end_date = _end_of_month(today.year, today.month)
         self._initial_portfolio_value = 10000
         self._num_simulations = 1000
         self._simulation_horizon = 10
-        self._ma_window = ""
+        self._ma_window = None
         self._start_date = "Earliest"
         self._theme_mode = "Light"
         self._trading_frequency = "Monthly"
@@ -30,7 +142,7 @@ class ModelsData:
         self._weights_filename = ""
         self._max_distance = 1.5
         self._ma_threshold_asset = ""
-        self._num_assets_to_select = ""
+        self._num_assets_to_select = None
         self._out_of_market_tickers = {}
         self._processing_type = str
         self._benchmark_asset = ""
@@ -41,11 +153,27 @@ class ModelsData:
         self._risk_tolerance = float(0.10)
         self._negative_mom = True
         self._ma_type = str
-        self._fast_ma_period = ""
-        self._slow_ma_period = ""
+        self._fast_ma_period = None
+        self._slow_ma_period = None
         self._use_tax = False
         self._tax_rate = 0.22
         self._discount_to_volatility = False
+        self._random_seed = None
+
+    def replace(self, **changes):
+        """
+        Returns a copy of the models data with the given attributes changed, leaving this instance untouched.
+
+        Args:
+            **changes: Attribute names and their new values, assigned through the setters.
+
+        Returns:
+            ModelsData: The updated copy.
+        """
+        models_data = copy.copy(self)
+        for name, value in changes.items():
+            setattr(models_data, name, value)
+        return models_data
 
 
     @property
@@ -140,7 +268,7 @@ class ModelsData:
         Returns:
             float: The initial portfolio value.
         """
-        return int(self._initial_portfolio_value)
+        return self._initial_portfolio_value
 
     @initial_portfolio_value.setter
     def initial_portfolio_value(self, value):
@@ -150,7 +278,7 @@ class ModelsData:
         Args:
             value (float): The initial portfolio value.
         """
-        self._initial_portfolio_value = value
+        self._initial_portfolio_value = _coerce(value, int)
 
 
     @property
@@ -161,7 +289,7 @@ class ModelsData:
         Returns:
             int: The number of simulations.
         """
-        return int(self._num_simulations)
+        return self._num_simulations
 
     @num_simulations.setter
     def num_simulations(self, value):
@@ -171,7 +299,7 @@ class ModelsData:
         Args:
             value (int): The number of simulations.
         """
-        self._num_simulations = value
+        self._num_simulations = _coerce(value, int)
 
 
     @property
@@ -182,7 +310,7 @@ class ModelsData:
         Returns:
             int: The simulation horizon in years.
         """
-        return int(self._simulation_horizon)
+        return self._simulation_horizon
 
     @simulation_horizon.setter
     def simulation_horizon(self, value):
@@ -192,7 +320,7 @@ class ModelsData:
         Args:
             value (int): The simulation horizon in years.
         """
-        self._simulation_horizon = value
+        self._simulation_horizon = _coerce(value, int)
 
 
     @property
@@ -201,9 +329,9 @@ class ModelsData:
         Gets the SMA (Simple Moving Average) window for the backtest or simulation.
 
         Returns:
-            int: The SMA window in days.
+            int or None: The SMA window in days, or None if not set.
         """
-        return int(self._ma_window)
+        return self._ma_window
 
     @ma_window.setter
     def ma_window(self, value):
@@ -213,7 +341,7 @@ class ModelsData:
         Args:
             value (int): The SMA window in days.
         """
-        self._ma_window = value
+        self._ma_window = _coerce_optional(value, int)
 
 
     @property
@@ -363,9 +491,9 @@ class ModelsData:
         Gets the threshold asset value used for portfolio management.
 
         Returns:
-            str: The threshold asset as a string.
+            int or None: The number of assets to select, or None if not set.
         """
-        return int(self._num_assets_to_select)
+        return self._num_assets_to_select
 
     @num_assets_to_select.setter
     def num_assets_to_select(self, value):
@@ -375,7 +503,7 @@ class ModelsData:
         Args:
             value (str): The asset ticker symbol to be set as the threshold asset.
         """
-        self._num_assets_to_select = value
+        self._num_assets_to_select = _coerce_optional(value, int)
 
 
     @property
@@ -449,7 +577,7 @@ class ModelsData:
         Returns:
             int: Integer representing the contribution.
         """
-        return int(self._contribution)
+        return self._contribution
 
     @contribution.setter
     def contribution(self, value):
@@ -459,7 +587,7 @@ class ModelsData:
         Args:
             value (int): Integer representing the contribution.
         """
-        self._contribution = value
+        self._contribution = _coerce(value, int)
 
 
     @property
@@ -480,6 +608,8 @@ class ModelsData:
         Args:
             value (str): String representing the contribution frequency.
         """
+        if value and value not in CONTRIBUTIONS_PER_YEAR:
+            raise ValueError("Invalid contribution frequency. Choose from 'monthly', 'quarterly', 'yearly'.")
         self._contribution_frequency = value
 
 
@@ -549,22 +679,22 @@ class ModelsData:
     @property
     def negative_mom(self):
         """
-        Gets the contribution.
+        Gets whether assets with negative momentum may be selected.
 
         Returns:
-            int: Integer representing the contribution.
+            bool: True if negative momentum assets are allowed.
         """
-        return bool(self._negative_mom)
+        return self._negative_mom
 
     @negative_mom.setter
     def negative_mom(self, value):
         """
-        Sets the contribution.
+        Sets whether assets with negative momentum may be selected.
 
         Args:
-            value (int): Integer representing the contribution.
+            value (bool or str): True/False, or a string such as "True" or "False" from the GUI.
         """
-        self._negative_mom = value
+        self._negative_mom = _coerce_bool(value)
 
 
     @property
@@ -594,9 +724,9 @@ class ModelsData:
         Gets the contribution.
 
         Returns:
-            int: Integer representing the contribution.
+            int or None: The moving average period in days, or None if not set.
         """
-        return int(self._fast_ma_period)
+        return self._fast_ma_period
 
     @fast_ma_period.setter
     def fast_ma_period(self, value):
@@ -606,7 +736,7 @@ class ModelsData:
         Args:
             value (int): Integer representing the contribution.
         """
-        self._fast_ma_period = value
+        self._fast_ma_period = _coerce_optional(value, int)
 
 
     @property
@@ -615,9 +745,9 @@ class ModelsData:
         Gets the contribution.
 
         Returns:
-            int: Integer representing the contribution.
+            int or None: The moving average period in days, or None if not set.
         """
-        return int(self._slow_ma_period)
+        return self._slow_ma_period
 
     @slow_ma_period.setter
     def slow_ma_period(self, value):
@@ -627,7 +757,7 @@ class ModelsData:
         Args:
             value (int): Integer representing the contribution.
         """
-        self._slow_ma_period = value
+        self._slow_ma_period = _coerce_optional(value, int)
 
 
     @property
@@ -659,7 +789,7 @@ class ModelsData:
         Returns:
             int: Integer representing the contribution.
         """
-        return float(self._tax_rate)
+        return self._tax_rate
 
     @tax_rate.setter
     def tax_rate(self, value):
@@ -669,7 +799,7 @@ class ModelsData:
         Args:
             value (int): Integer representing the contribution.
         """
-        self._tax_rate = value
+        self._tax_rate = _coerce(value, float)
 
 
     @property
@@ -691,3 +821,23 @@ class ModelsData:
             value (int): Integer representing the contribution.
         """
         self._discount_to_volatility = value
+
+    @property
+    def random_seed(self):
+        """
+        Gets the random seed for Monte Carlo simulations.
+
+        Returns:
+            int or None: The seed, or None to draw fresh entropy on every run.
+        """
+        return self._random_seed
+
+    @random_seed.setter
+    def random_seed(self, value):
+        """
+        Sets the random seed for Monte Carlo simulations.
+
+        Args:
+            value (int or None): The seed, or None to draw fresh entropy on every run.
+        """
+        self._random_seed = _coerce_optional(value, int)
@@ -2,15 +2,58 @@
 Models factory for handling different backtesting models and runs.
 """
 
+import importlib
+
 from strategy_analyzer.processing_types import *
-from strategy_analyzer.models.create_signals import *
-from strategy_analyzer.models.backtest_models import *
-from strategy_analyzer.models.monte_carlo_simulation import *
-from strategy_analyzer.models.parameter_tuning import *
 from strategy_analyzer.models.models_data import ModelsData
 from strategy_analyzer.data.portfolio_data import PortfolioData
 from strategy_analyzer.results.models_results import ModelsResults
 
+_BACKTEST_MODELS = "strategy_analyzer.models.backtest_models"
+_SIGNALS = "strategy_analyzer.models.create_signals"
+_SIMULATION = "strategy_analyzer.models.monte_carlo_simulation.monte_carlo_sim"
+_TUNING = "strategy_analyzer.models.parameter_tuning"
+
+# Processors are imported on first use so a session only loads the stacks of the models it runs.
+_PROCESSOR_MAP = {
+    Models.MA: {
+        ProcessType.BACKTEST: (
+            f"{_BACKTEST_MODELS}.moving_average_backtest_processor", "MovingAverageBacktestProcessor"
+        ),
+        ProcessType.SIGNALS: (f"{_SIGNALS}.create_moving_average_signals", "CreateMovingAverageSignals"),
+        ProcessType.SIMULATION: (_SIMULATION, "MonteCarloSimulation"),
+        ProcessType.TUNE: (f"{_TUNING}.ma_parameter_tuning", "MovingAverageParameterTuning")
+    },
+    Models.MOMENTUM: {
+        ProcessType.BACKTEST: (f"{_BACKTEST_MODELS}.momentum_backtest_processor", "MomentumBacktestProcessor"),
+        ProcessType.SIGNALS: (f"{_SIGNALS}.create_momentum_signals", "CreateMomentumSignals"),
+        ProcessType.SIMULATION: (_SIMULATION, "MonteCarloSimulation"),
+        ProcessType.TUNE: (f"{_TUNING}.momentum_parameter_tuning", "MomentumParameterTuning")
+    },
+    Models.IN_AND_OUT_OF_MARKET: {
+        ProcessType.BACKTEST: (f"{_BACKTEST_MODELS}.iao_momentum_backtest_processor", "IAOMomentumBacktestProcessor"),
+        ProcessType.SIGNALS: (f"{_SIGNALS}.create_momentumiao_signals", "CreateMomentumInAndOutSignals"),
+        ProcessType.SIMULATION: (_SIMULATION, "MonteCarloSimulation"),
+        ProcessType.TUNE: (f"{_TUNING}.in_and_out_momentum_parameter_tuning", "InAndOutMomentumParameterTuning")
+    },
+    Models.MACHINE_LEARNING: {
+        ProcessType.BACKTEST: (
+            f"{_BACKTEST_MODELS}.hierarchal_clustering_processor", "HierarchicalClusteringBacktestProcessor"
+        ),
+        ProcessType.TUNE: (f"{_TUNING}.hierarchal_clustering_parametertuning", "HierarchalClusteringParameterTuning")
+    },
+    Models.MA_CROSSOVER: {
+        ProcessType.BACKTEST: (
+            f"{_BACKTEST_MODELS}.moving_average_crossover_processor", "MovingAverageCrossoverProcessor"
+        ),
+        ProcessType.TUNE: (f"{_TUNING}.ma_crossover_parameter_tuning", "MaCrossoverParameterTuning")
+    }
+}
+
+_PROCESSOR_CACHE = {}
+_EMPTY = {}
+
+
 class ModelsFactory:
     """
     Factory class to handle model processing based on the provided enum types.
@@ -24,37 +67,17 @@ class ModelsFactory:
         """
         Executes the corresponding method based on the provided model and run type.
         """
-        model_run_map = {
-            (Models.MA, Runs.BACKTEST): self._run_backtest,
-            (Models.MA, Runs.SIGNALS): self._run_signals,
-            (Models.MA, Runs.SIMULATION): self._run_simulation,
-            (Models.MA, Runs.PARAMETER_TUNE): self._run_parameter_tune,
-            (Models.MOMENTUM, Runs.BACKTEST): self._run_backtest,
-            (Models.MOMENTUM, Runs.SIGNALS): self._run_signals,
-            (Models.MOMENTUM, Runs.SIMULATION): self._run_simulation,
-            (Models.MOMENTUM, Runs.PARAMETER_TUNE): self._run_parameter_tune,
-            (Models.IN_AND_OUT_OF_MARKET, Runs.BACKTEST): self._run_backtest,
-            (Models.IN_AND_OUT_OF_MARKET, Runs.SIGNALS): self._run_signals,
-            (Models.IN_AND_OUT_OF_MARKET, Runs.SIMULATION): self._run_simulation,
-            (Models.IN_AND_OUT_OF_MARKET, Runs.PARAMETER_TUNE): self._run_parameter_tune,
-            (Models.MACHINE_LEARNING, Runs.BACKTEST): self._run_backtest,
-            (Models.MACHINE_LEARNING, Runs.PARAMETER_TUNE): self._run_parameter_tune,
-            (Models.MA_CROSSOVER, Runs.BACKTEST): self._run_backtest,
-            (Models.MA_CROSSOVER, Runs.PARAMETER_TUNE): self._run_parameter_tune
-        }
-
-        method = model_run_map.get((model, run_type))
-        if not method:
+        if (model, run_type) not in self._VALID_COMBOS:
             return "Invalid model or run type combination."
 
-        self.data_models.processing_type = f"{model.name}_{run_type.name}"
-        return method(model)
+        self.data_models.processing_type = self._PROC_TYPE_CACHE[(model, run_type)]
+        return self._RUN_HANDLERS[run_type](self, model)
 
     def _run_backtest(self, model: Models) -> str:
         if not self.data_models.assets_weights:
             return "Please load asset weights file."
 
-        processor_class = self._get_processor_class(model, "backtest")
+        processor_class = self._get_processor_class(model, ProcessType.BACKTEST)
         if not processor_class:
             return "No backtest processor found for this model."
 
@@ -70,7 +93,7 @@ class ModelsFactory:
         if not self.data_models.assets_weights:
             return "Please load asset weights file."
 
-        processor_class = self._get_processor_class(model, "signals")
+        processor_class = self._get_processor_class(model, ProcessType.SIGNALS)
         if not processor_class:
             return "No signals processor found for this model."
 
@@ -86,8 +109,8 @@ class ModelsFactory:
         if not self.data_models.assets_weights:
             return "Please load asset weights file."
 
-        backtest_class = self._get_processor_class(model, "backtest")
-        simulation_class = self._get_processor_class(model, "simulation")
+        backtest_class = self._get_processor_class(model, ProcessType.BACKTEST)
+        simulation_class = self._get_processor_class(model, ProcessType.SIMULATION)
 
         if not backtest_class or not simulation_class:
             return "No simulation processor found for this model."
@@ -110,7 +133,7 @@ class ModelsFactory:
         if not self.data_models.assets_weights:
             return "Please load asset weights file."
 
-        processor_class = self._get_processor_class(model, "tune")
+        processor_class = self._get_processor_class(model, ProcessType.TUNE)
         if not processor_class:
             return "No parameter tuning processor found for this model."
 
@@ -122,33 +145,38 @@ class ModelsFactory:
         processor.process()
         return f"{model.name} parameter tuning completed."
 
-    def _get_processor_class(self, model: Models, process_type: str):
-        processor_map = {
-            "MA": {
-                "backtest": MovingAverageBacktestProcessor,
-                "signals": CreateMovingAverageSignals,
-                "simulation": MonteCarloSimulation,
-                "tune": MovingAverageParameterTuning
-            },
-            "MOMENTUM": {
-                "backtest": MomentumBacktestProcessor,
-                "signals": CreateMomentumSignals,
-                "simulation": MonteCarloSimulation,
-                "tune": MomentumParameterTuning
-            },
-            "IN_AND_OUT_OF_MARKET": {
-                "backtest": IAOMomentumBacktestProcessor,
-                "signals": CreateMomentumInAndOutSignals,
-                "simulation": MonteCarloSimulation,
-                "tune": InAndOutMomentumParameterTuning
-            },
-            "MACHINE_LEARNING": {
-                "backtest": HierarchicalClusteringBacktestProcessor,
-                "tune": HierarchalClusteringParameterTuning
-            },
-            "MA_CROSSOVER": {
-                "backtest": MovingAverageCrossoverProcessor,
-                "tune": MaCrossoverParameterTuning
-            }
-        }
-        return processor_map.get(model.name, {}).get(process_type)
+    def _get_processor_class(self, model: Models, process_type: ProcessType):
+        key = (model, process_type)
+        if key not in _PROCESSOR_CACHE:
+            location = _PROCESSOR_MAP.get(model, _EMPTY).get(process_type)
+            _PROCESSOR_CACHE[key] = getattr(importlib.import_module(location[0]), location[1]) if location else None
+
+        return _PROCESSOR_CACHE[key]
+
+    _RUN_HANDLERS = {
+        Runs.BACKTEST: _run_backtest,
+        Runs.SIGNALS: _run_signals,
+        Runs.SIMULATION: _run_simulation,
+        Runs.PARAMETER_TUNE: _run_parameter_tune
+    }
+
+    _VALID_COMBOS = frozenset([
+        (Models.MA, Runs.BACKTEST),
+        (Models.MA, Runs.SIGNALS),
+        (Models.MA, Runs.SIMULATION),
+        (Models.MA, Runs.PARAMETER_TUNE),
+        (Models.MOMENTUM, Runs.BACKTEST),
+        (Models.MOMENTUM, Runs.SIGNALS),
+        (Models.MOMENTUM, Runs.SIMULATION),
+        (Models.MOMENTUM, Runs.PARAMETER_TUNE),
+        (Models.IN_AND_OUT_OF_MARKET, Runs.BACKTEST),
+        (Models.IN_AND_OUT_OF_MARKET, Runs.SIGNALS),
+        (Models.IN_AND_OUT_OF_MARKET, Runs.SIMULATION),
+        (Models.IN_AND_OUT_OF_MARKET, Runs.PARAMETER_TUNE),
+        (Models.MACHINE_LEARNING, Runs.BACKTEST),
+        (Models.MACHINE_LEARNING, Runs.PARAMETER_TUNE),
+        (Models.MA_CROSSOVER, Runs.BACKTEST),
+        (Models.MA_CROSSOVER, Runs.PARAMETER_TUNE)
+    ])
+
+    _PROC_TYPE_CACHE = {(model, run_type): f"{model.name}_{run_type.name}" for model in Models for run_type in Runs}
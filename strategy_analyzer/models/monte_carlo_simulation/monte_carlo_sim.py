@@ -5,8 +5,9 @@ Processor for running MonteCarlo simulations.
 import numpy as np
 import pandas as pd
 
+import strategy_analyzer.utilities as utilities
 from strategy_analyzer.results.simulation_results_processor import SimulationResultsProcessor
-from strategy_analyzer.models.models_data import ModelsData
+from strategy_analyzer.models.models_data import CONTRIBUTIONS_PER_YEAR, ModelsData
 from strategy_analyzer.results.models_results import ModelsResults
 
 
@@ -41,6 +42,7 @@ class MonteCarloSimulation:
         """
         self.data_models = models_data
         self.results_models = models_results
+        self.rng = np.random.default_rng(models_data.random_seed)
 
 
     def process(self):
@@ -52,43 +54,68 @@ class MonteCarloSimulation:
         results_processor.process()
 
 
-    def run_simulation(self):
+    def run_simulation(self, dtype=np.float32):
         """
         Runs the Monte Carlo simulation with optional contributions, accommodating annual simulation periods.
 
         Parameters
         ----------
-        contribution : float
-            Amount to be added to the portfolio at each contribution interval.
-        contribution_frequency : str
-            Frequency of contributions ("monthly", "quarterly", "yearly").
+        dtype : data-type, optional
+            Floating point type of the simulated values (default is float32, which is ample for plotting
+            percentiles and halves the memory traffic of the simulation).
 
         Returns
         -------
         DataFrame
             DataFrame containing the simulated portfolio values.
         """
-        simulation_results = np.zeros((self.data_models.simulation_horizon + 1, self.data_models.num_simulations))
-        simulation_results[0] = self.data_models.initial_portfolio_value
-
-        if self.data_models.contribution and self.data_models.contribution_frequency:
-            if self.data_models.contribution_frequency == "Monthly":
-                contribution = self.data_models.contribution*12
-            elif self.data_models.contribution_frequency == "Quarterly":
-                contribution = self.data_models.contribution*4
-            elif self.data_models.contribution_frequency == "Yearly":
-                contribution = self.data_models.contribution
-            else:
-                raise ValueError("Invalid contribution frequency. Choose from 'monthly', 'quarterly', 'yearly'.")
+        horizon = self.data_models.simulation_horizon
+        num_simulations = self.data_models.num_simulations
+        contribution = self.data_models.contribution
+        contribution_frequency = self.data_models.contribution_frequency
+        average_annual_return = self.results_models.average_annual_return
+        annual_volatility = self.results_models.annual_volatility
+
+        if contribution and contribution_frequency:
+            try:
+                contribution *= CONTRIBUTIONS_PER_YEAR[contribution_frequency]
+            except KeyError as error:
+                raise ValueError(
+                    "Invalid contribution frequency. Choose from 'monthly', 'quarterly', 'yearly'."
+                ) from error
         else:
             contribution = 0
 
-        for t in range(1, self.data_models.simulation_horizon + 1):
-            random_returns = np.random.normal(
-                self.results_models.average_annual_return, self.results_models.annual_volatility, self.data_models.num_simulations
+        simulation_results = np.empty((horizon + 1, num_simulations), dtype=dtype)
+        simulation_results[0] = self.data_models.initial_portfolio_value
+
+        if contribution and utilities.NUMBA_AVAILABLE:
+            # The draws come from self.rng rather than numba's own generator, so random_seed is honoured.
+            utilities.simulate_portfolio_paths(
+                self.data_models.initial_portfolio_value,
+                average_annual_return,
+                annual_volatility,
+                contribution,
+                self.rng.standard_normal((horizon, num_simulations), dtype=dtype),
+                simulation_results,
+            )
+        elif contribution:
+            growth = self.rng.standard_normal((horizon, num_simulations), dtype=dtype)
+            growth *= annual_volatility
+            growth += 1 + average_annual_return
+            np.cumprod(growth, axis=0, out=growth)
+            # S_t = S_(t-1) * (1 + r_t) + c  unrolls to  G_t * (S_0 + c * sum_(k<=t) 1 / G_k).
+            np.multiply(
+                growth,
+                simulation_results[0] + contribution * np.cumsum(1 / growth, axis=0),
+                out=simulation_results[1:],
             )
-            simulation_results[t] = simulation_results[t - 1] * (1 + random_returns)
+        else:
+            # Growth factors go straight below the initial row, so one cumprod yields the portfolio values.
+            returns = simulation_results[1:]
+            self.rng.standard_normal(dtype=dtype, out=returns)
+            returns *= annual_volatility
+            returns += 1 + average_annual_return
+            np.cumprod(simulation_results, axis=0, out=simulation_results)
 
-            simulation_results[t] += contribution
-        print(simulation_results)
         self.results_models.simulation_results = simulation_results
@@ -2,9 +2,8 @@
 Module for creating momentum based parameters.
 """
 
-from multiprocessing import Pool
-
-from tqdm import tqdm
+import functools
+import itertools
 
 from strategy_analyzer.models.models_data import ModelsData
 from strategy_analyzer.data.portfolio_data import PortfolioData
@@ -12,6 +11,38 @@ from strategy_analyzer.models.parameter_tuning.parameter_tuning_processor import
 from strategy_analyzer.models.backtest_models.hierarchal_clustering_processor import HierarchicalClusteringBacktestProcessor
 from strategy_analyzer.results.models_results import ModelsResults
 
+_MA_LIST = (21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252)
+_NUM_ASSET_LIST = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+_TRADING_FREQUENCIES = ("Monthly", "Bi-Monthly", "Quarterly", "Yearly")
+_MA_TYPES = ("SMA", "EMA")
+
+
+@functools.lru_cache(maxsize=None)
+def _backtest_combinations() -> tuple:
+    """
+    Returns the combinations that change the clustering backtest.
+
+    Combinations sharing a moving average are kept next to each other, so the pool hands them to the
+    same worker in one chunk and the worker reuses the cached moving average arrays across them.
+    """
+    return tuple(
+        (ma, frequency, ma_type)
+        for ma, ma_type in itertools.product(_MA_LIST, _MA_TYPES)
+        for frequency in _TRADING_FREQUENCIES
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _parameter_combinations(total_assets: int) -> tuple:
+    """
+    Returns the tuning grid for a portfolio of total_assets assets, with the backtest row of each combination.
+    """
+    rows = {combination: row for row, combination in enumerate(_backtest_combinations())}
+    num_asset_list = [num_assets for num_assets in _NUM_ASSET_LIST if num_assets <= total_assets]
+    combinations = tuple(itertools.product(_MA_LIST, _TRADING_FREQUENCIES, num_asset_list, _MA_TYPES))
+
+    return combinations, [rows[(ma, frequency, ma_type)] for ma, frequency, _, ma_type in combinations]
+
 
 class HierarchalClusteringParameterTuning(ParameterTuningProcessor):
     """
@@ -28,43 +59,26 @@ class HierarchalClusteringParameterTuning(ParameterTuningProcessor):
         """
         super().__init__(models_data=models_data, portfolio_data=portfolio_data, models_results=models_results)
 
-    def get_portfolio_results(self) -> dict:
+    def get_portfolio_results(self) -> tuple:
         """
         Processes parameters for tuning using joblib to parallelize execution.
 
         Returns
         -------
-        dict
-            A dictionary of backtest results and portfolio statistics from parameter tuning.
+        tuple
+            The parameter combinations and a structured array of their statistics, row for row.
         """
-        results = {}
-        ma_list = [21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252]
-        num_asset_list = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-        trading_frequencies = ["Monthly", "Bi-Monthly", "Quarterly", "Yearly"]
-        ma_types = ["SMA", "EMA"]
-
-        total_assets = len(self.data_models.assets_weights)
-
-        parameter_combinations = [
-            (ma, ma, frequency, ma_type)
-            for ma in ma_list
-            for frequency in trading_frequencies
-            for num_assets in num_asset_list if num_assets <= total_assets
-            for ma_type in ma_types
-        ]
-
-        with Pool() as pool:
-            for params, result in zip(
-                parameter_combinations,
-                tqdm(pool.imap(self.process_combination_wrapper, parameter_combinations), 
-                    total=len(parameter_combinations), 
-                    desc="Processing combinations")
-            ):
-                results[params] = result
-
-        return results
-
-    def process_combination_wrapper(self, args) -> dict:
+        # The clustering backtest does not depend on num_assets, so run one backtest per remaining combination
+        # and share its result across every asset count.
+        parameter_combinations = _backtest_combinations()
+
+        backtest_statistics = self.run_combinations(parameter_combinations)
+
+        combinations, rows = _parameter_combinations(len(self.data_models.assets_weights))
+
+        return combinations, backtest_statistics[rows]
+
+    def process_combination_wrapper(self, args) -> tuple:
         """
         Wrapper function for processing a combination.
         Calls the class method with unpacked arguments.
@@ -76,14 +90,14 @@ class HierarchalClusteringParameterTuning(ParameterTuningProcessor):
 
         Returns
         -------
-        dict
-            The result of the combination processing.
+        tuple
+            The backtest statistics for the combination.
         """
-        ma, frequency, num_assets, ma_type = args
+        ma, frequency, ma_type = args
 
-        return self.process_combination(ma, frequency, num_assets, ma_type)
+        return self.process_combination(ma, frequency, ma_type)
 
-    def process_combination(self, ma, frequency, num_assets, ma_type) -> dict:
+    def process_combination(self, ma, frequency, ma_type) -> tuple:
         """
         Processes a single parameter combination and returns the backtest results.
 
@@ -93,33 +107,25 @@ class HierarchalClusteringParameterTuning(ParameterTuningProcessor):
             Moving average window.
         frequency : str
             Trading frequency.
-        num_assets : int
-            Number of assets to select.
         ma_type : str
             Type of moving average (SMA or EMA).
 
         Returns
         -------
-        dict
-            The backtest results for the given parameter combination.
+        tuple
+            The backtest statistics for the given parameter combination.
         """
-        self.data_models.ma_window = ma
-        self.data_models.trading_frequency = frequency
-        self.data_models.num_assets_to_select = num_assets
-        self.data_models.ma_type = ma_type
+        models_data = self.data_models.replace(
+            ma_window=ma,
+            trading_frequency=frequency,
+            ma_type=ma_type
+        )
 
         backtest = HierarchicalClusteringBacktestProcessor(
-            models_data=self.data_models, 
+            models_data=models_data,
             portfolio_data=self.data_portfolio,
             models_results=self.results_models
         )
         backtest.process()
 
-        return {
-            "cagr": self.results_models.cagr,
-            "average_annual_return": self.results_models.average_annual_return,
-            "max_drawdown": self.results_models.max_drawdown,
-            "var": self.results_models.var,
-            "cvar": self.results_models.cvar,
-            "annual_volatility": self.results_models.annual_volatility,
-        }
+        return self.get_statistics()
@@ -2,9 +2,8 @@
 Module for creating momentum based parameters.
 """
 
-from multiprocessing import Pool
-
-from tqdm import tqdm
+import functools
+import itertools
 
 from strategy_analyzer.models.models_data import ModelsData
 from strategy_analyzer.data.portfolio_data import PortfolioData
@@ -12,6 +11,20 @@ from strategy_analyzer.models.parameter_tuning.parameter_tuning_processor import
 from strategy_analyzer.models.backtest_models.iao_momentum_backtest_processor import IAOMomentumBacktestProcessor
 from strategy_analyzer.results.models_results import ModelsResults
 
+_MA_LIST = (21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252)
+_NUM_ASSET_LIST = (1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+_TRADING_FREQUENCIES = ("Monthly", "Bi-Monthly", "Quarterly", "Yearly")
+_MA_TYPES = ("SMA", "EMA")
+
+
+@functools.lru_cache(maxsize=None)
+def _parameter_combinations(total_assets: int) -> tuple:
+    """
+    Returns the tuning grid for a portfolio of total_assets assets.
+    """
+    num_asset_list = [num_assets for num_assets in _NUM_ASSET_LIST if num_assets <= total_assets]
+    return tuple(itertools.product(_MA_LIST, _TRADING_FREQUENCIES, num_asset_list, _MA_TYPES))
+
 
 class InAndOutMomentumParameterTuning(ParameterTuningProcessor):
     """
@@ -28,43 +41,20 @@ class InAndOutMomentumParameterTuning(ParameterTuningProcessor):
         """
         super().__init__(models_data=models_data, portfolio_data=portfolio_data, models_results=models_results)
 
-    def get_portfolio_results(self) -> dict:
+    def get_portfolio_results(self) -> tuple:
         """
         Processes parameters for tuning using joblib to parallelize execution.
 
         Returns
         -------
-        dict
-            A dictionary of backtest results and portfolio statistics from parameter tuning.
+        tuple
+            The parameter combinations and a structured array of their statistics, row for row.
         """
-        results = {}
-        ma_list = [21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252]
-        num_asset_list = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-        trading_frequencies = ["Monthly", "Bi-Monthly", "Quarterly", "Yearly"]
-        ma_types = ["SMA", "EMA"]
-
-        total_assets = len(self.data_models.assets_weights)
-
-        parameter_combinations = [
-            (ma, frequency, num_assets, ma_type)
-            for ma in ma_list
-            for frequency in trading_frequencies
-            for num_assets in num_asset_list if num_assets <= total_assets
-            for ma_type in ma_types
-        ]
-
-        with Pool() as pool:
-            for params, result in zip(
-                parameter_combinations,
-                tqdm(pool.imap(self.process_combination_wrapper, parameter_combinations), 
-                    total=len(parameter_combinations), 
-                    desc="Processing combinations")
-            ):
-                results[params] = result
-
-        return results
-
-    def process_combination_wrapper(self, args) -> dict:
+        parameter_combinations = _parameter_combinations(len(self.data_models.assets_weights))
+
+        return parameter_combinations, self.run_combinations(parameter_combinations)
+
+    def process_combination_wrapper(self, args) -> tuple:
         """
         Wrapper function for processing a combination.
         Calls the class method with unpacked arguments.
@@ -76,14 +66,14 @@ class InAndOutMomentumParameterTuning(ParameterTuningProcessor):
 
         Returns
         -------
-        dict
-            The result of the combination processing.
+        tuple
+            The backtest statistics for the combination.
         """
         ma, frequency, num_assets, ma_type = args
 
         return self.process_combination(ma, frequency, num_assets, ma_type)
 
-    def process_combination(self, ma, frequency, num_assets, ma_type) -> dict:
+    def process_combination(self, ma, frequency, num_assets, ma_type) -> tuple:
         """
         Processes a single parameter combination and returns the backtest results.
 
@@ -100,26 +90,21 @@ class InAndOutMomentumParameterTuning(ParameterTuningProcessor):
 
         Returns
         -------
-        dict
-            The backtest results for the given parameter combination.
+        tuple
+            The backtest statistics for the given parameter combination.
         """
-        self.data_models.ma_window = ma
-        self.data_models.trading_frequency = frequency
-        self.data_models.num_assets_to_select = num_assets
-        self.data_models.ma_type = ma_type
+        models_data = self.data_models.replace(
+            ma_window=ma,
+            trading_frequency=frequency,
+            num_assets_to_select=num_assets,
+            ma_type=ma_type
+        )
 
         backtest = IAOMomentumBacktestProcessor(
-            models_data=self.data_models, 
+            models_data=models_data,
             portfolio_data=self.data_portfolio,
             models_results=self.results_models
         )
         backtest.process()
 
-        return {
-            "cagr": self.results_models.cagr,
-            "average_annual_return": self.results_models.average_annual_return,
-            "max_drawdown": self.results_models.max_drawdown,
-            "var": self.results_models.var,
-            "cvar": self.results_models.cvar,
-            "annual_volatility": self.results_models.annual_volatility,
-        }
+        return self.get_statistics()
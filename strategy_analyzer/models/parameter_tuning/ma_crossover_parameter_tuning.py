@@ -2,9 +2,8 @@
 Module for creating momentum based parameters.
 """
 
-from multiprocessing import Pool
-
-from tqdm import tqdm
+import functools
+import itertools
 
 from strategy_analyzer.models.models_data import ModelsData
 from strategy_analyzer.data.portfolio_data import PortfolioData
@@ -12,6 +11,20 @@ from strategy_analyzer.models.parameter_tuning.parameter_tuning_processor import
 from strategy_analyzer.models.backtest_models.moving_average_crossover_processor import MovingAverageCrossoverProcessor
 from strategy_analyzer.results.models_results import ModelsResults
 
+_MA_LIST = (21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252)
+_FAST_MA_LIST = (21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252)
+_SLOW_MA_LIST = (21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252)
+_TRADING_FREQUENCIES = ("Monthly", "Bi-Monthly", "Quarterly", "Yearly")
+_MA_TYPES = ("SMA", "EMA")
+
+
+@functools.lru_cache(maxsize=None)
+def _parameter_combinations() -> tuple:
+    """
+    Returns the tuning grid.
+    """
+    return tuple(itertools.product(_MA_LIST, _FAST_MA_LIST, _SLOW_MA_LIST, _TRADING_FREQUENCIES, _MA_TYPES))
+
 
 class MaCrossoverParameterTuning(ParameterTuningProcessor):
     """
@@ -28,43 +41,20 @@ class MaCrossoverParameterTuning(ParameterTuningProcessor):
         """
         super().__init__(models_data=models_data, portfolio_data=portfolio_data, models_results=models_results)
 
-    def get_portfolio_results(self) -> dict:
+    def get_portfolio_results(self) -> tuple:
         """
         Processes parameters for tuning using joblib to parallelize execution.
 
         Returns
         -------
-        dict
-            A dictionary of backtest results and portfolio statistics from parameter tuning.
+        tuple
+            The parameter combinations and a structured array of their statistics, row for row.
         """
-        results = {}
-        ma_list = [21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252]
-        fast_ma_list = [21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252]
-        slow_ma_list = [21, 42, 63, 84, 105, 126, 147, 168, 189, 210, 231, 252]
-        trading_frequencies = ["Monthly", "Bi-Monthly", "Quarterly", "Yearly"]
-        ma_types = ["SMA", "EMA"]
-
-        parameter_combinations = [
-            (ma, fast, slow, frequency, ma_type)
-            for ma in ma_list
-            for fast in fast_ma_list
-            for slow in slow_ma_list
-            for frequency in trading_frequencies
-            for ma_type in ma_types
-        ]
-
-        with Pool() as pool:
-            for params, result in zip(
-                parameter_combinations,
-                tqdm(pool.imap(self.process_combination_wrapper, parameter_combinations), 
-                    total=len(parameter_combinations), 
-                    desc="Processing combinations")
-            ):
-                results[params] = result
-
-        return results
-
-    def process_combination_wrapper(self, args) -> dict:
+        parameter_combinations = _parameter_combinations()
+
+        return parameter_combinations, self.run_combinations(parameter_combinations)
+
+    def process_combination_wrapper(self, args) -> tuple:
         """
         Wrapper function for processing a combination.
         Calls the class method with unpacked arguments.
@@ -76,14 +66,14 @@ class MaCrossoverParameterTuning(ParameterTuningProcessor):
 
         Returns
         -------
-        dict
-            The result of the combination processing.
+        tuple
+            The backtest statistics for the combination.
         """
         ma, fast, slow, frequency, ma_type = args
 
         return self.process_combination(ma, fast, slow, frequency, ma_type)
 
-    def process_combination(self, ma, fast, slow, frequency, ma_type) -> dict:
+    def process_combination(self, ma, fast, slow, frequency, ma_type) -> tuple:
         """
         Processes a single parameter combination and returns the backtest results.
 
@@ -100,27 +90,22 @@ class MaCrossoverParameterTuning(ParameterTuningProcessor):
 
         Returns
         -------
-        dict
-            The backtest results for the given parameter combination.
+        tuple
+            The backtest statistics for the given parameter combination.
         """
-        self.data_models.ma_window = ma
-        self.data_models.trading_frequency = frequency
-        self.data_models.ma_type = ma_type
-        self.data_models.slow_ma_period = slow
-        self.data_models.fast_ma_period = fast
+        models_data = self.data_models.replace(
+            ma_window=ma,
+            trading_frequency=frequency,
+            ma_type=ma_type,
+            slow_ma_period=slow,
+            fast_ma_period=fast
+        )
 
         backtest = MovingAverageCrossoverProcessor(
-            models_data=self.data_models, 
+            models_data=models_data,
             portfolio_data=self.data_portfolio,
             models_results=self.results_models
         )
         backtest.process()
 
-        return {
-            "cagr": self.results_models.cagr,
-            "average_annual_return": self.results_models.average_annual_return,
-            "max_drawdown": self.results_models.max_drawdown,
-            "var": self.results_models.var,
-            "cvar": self.results_models.cvar,
-            "annual_volatility": self.results_models.annual_volatility,
-        }
+        return self.get_statistics()
@@ -2,15 +2,114 @@
 Abstract module for processing parameter tuning.
 """
 
+import copy
 import json
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+from tqdm import tqdm
 
 from strategy_analyzer.models.models_data import ModelsData
 from strategy_analyzer.data.portfolio_data import PortfolioData
 from strategy_analyzer.results.models_results import ModelsResults
 from strategy_analyzer.results.parameter_tuning_results_processor import ParameterTuningResultsProcessor
 
+_SHARED_FRAMES = (
+    "assets_data",
+    "trading_data",
+    "benchmark_data",
+    "bond_data",
+    "cash_data",
+    "ma_threshold_data",
+    "out_of_market_data",
+)
+
+# Single precision is ample for statistics that are only ever shown as percentages with two decimals.
+_STATISTICS_DTYPE = np.dtype([
+    ("cagr", "f4"),
+    ("average_annual_return", "f4"),
+    ("max_drawdown", "f4"),
+    ("var", "f4"),
+    ("cvar", "f4"),
+    ("annual_volatility", "f4"),
+])
+
+_WORKER_STATE = {}
+
+
+def _share_frames(portfolio_data: PortfolioData):
+    """
+    Copies the numeric price frames of portfolio_data into shared memory.
+
+    Returns a copy of portfolio_data without those frames, the specs needed to rebuild them in a worker,
+    and the shared memory blocks, which the caller must close and unlink.
+    """
+    stripped = copy.copy(portfolio_data)
+    specs = []
+    blocks = {}
+
+    for attribute in _SHARED_FRAMES:
+        frame = getattr(portfolio_data, attribute)
+        if not isinstance(frame, pd.DataFrame) or frame.empty:
+            continue
+
+        values = frame.to_numpy()
+        if values.dtype == object:
+            continue
+
+        # Frames that are the same object share one block.
+        if id(frame) not in blocks:
+            block = SharedMemory(create=True, size=values.nbytes)
+            np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+            blocks[id(frame)] = block
+
+        specs.append((attribute, blocks[id(frame)].name, values.shape, values.dtype.str, frame.index, frame.columns))
+        setattr(stripped, attribute, None)
+
+    return stripped, specs, list(blocks.values())
+
+
+def _init_worker(tuner_class, models_data: ModelsData, portfolio_data: PortfolioData, shared_frames: list):
+    """
+    Stores the tuner class and its inputs in a pool worker, so they are sent once per worker
+    instead of with every task. The price frames are mapped straight onto the parent's shared memory.
+    """
+    blocks = {}
+    frames = {}
+    for attribute, name, shape, dtype, index, columns in shared_frames:
+        if name not in blocks:
+            blocks[name] = SharedMemory(name=name)
+            frames[name] = pd.DataFrame(
+                np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf), index=index, columns=columns, copy=False
+            )
+        setattr(portfolio_data, attribute, frames[name])
+
+    _WORKER_STATE["shared_memory"] = blocks
+    _WORKER_STATE["models_results"] = ModelsResults()
+    _WORKER_STATE["tuner_class"] = tuner_class
+    _WORKER_STATE["models_data"] = models_data
+    _WORKER_STATE["portfolio_data"] = portfolio_data
+
+
+def _process_combination(args) -> tuple:
+    """
+    Processes a combination in a pool worker. The worker's results instance is reset rather than
+    reallocated for every task, so no statistics leak between tasks.
+    """
+    models_results = _WORKER_STATE["models_results"]
+    models_results.reset()
+    tuner = _WORKER_STATE["tuner_class"](
+        models_data=_WORKER_STATE["models_data"],
+        portfolio_data=_WORKER_STATE["portfolio_data"],
+        models_results=models_results
+    )
+    return tuner.process_combination_wrapper(args)
+
 
 class ParameterTuningProcessor(ABC):
     """
@@ -33,22 +132,22 @@ class ParameterTuningProcessor(ABC):
         """
         Abstract method to process data and generate trading signals.
         """
-        results = self.get_portfolio_results()
-        self.plot_results(results=results)
+        combinations, statistics = self.get_portfolio_results()
+        self.plot_results(combinations=combinations, statistics=statistics)
 
     @abstractmethod
-    def get_portfolio_results(self) -> dict:
+    def get_portfolio_results(self) -> tuple:
         """
         Processes parameters for tuning using joblib to parallelize execution.
 
         Returns
         -------
-        dict
-            A dictionary of backtest results and portfolio statistics from parameter tuning.
+        tuple
+            The parameter combinations and a structured array of their statistics, row for row.
         """
 
     @abstractmethod
-    def process_combination_wrapper(self, args) -> dict:
+    def process_combination_wrapper(self, args) -> tuple:
         """
         Wrapper function for processing a combination.
         Calls the class method with unpacked arguments.
@@ -60,16 +159,99 @@ class ParameterTuningProcessor(ABC):
 
         Returns
         -------
-        dict
-            The result of the combination processing.
+        tuple
+            The backtest statistics for the combination.
+        """
+
+    def run_combinations(self, parameter_combinations: tuple) -> np.ndarray:
+        """
+        Processes every parameter combination across a pool of worker processes.
+
+        The price frames are placed in shared memory and the rest of the models and portfolio data is bound
+        to each worker once by the pool initializer, so tasks only carry their combination. Workers are
+        started from a forkserver where available, so they do not inherit the GUI process.
+
+        Parameters
+        ----------
+        parameter_combinations : tuple
+            The parameter tuples to process.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one row of statistics per combination, in the order of parameter_combinations.
+        """
+        statistics = np.empty(len(parameter_combinations), dtype=_STATISTICS_DTYPE)
+        start_method = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+        portfolio_data, shared_frames, blocks = _share_frames(portfolio_data=self.data_portfolio)
+
+        try:
+            with ProcessPoolExecutor(
+                mp_context=get_context(start_method),
+                initializer=_init_worker,
+                initargs=(type(self), self.data_models, portfolio_data, shared_frames)
+            ) as executor:
+                for row, result in enumerate(tqdm(
+                    executor.map(_process_combination, parameter_combinations,
+                                 chunksize=self.get_chunksize(len(parameter_combinations))),
+                    total=len(parameter_combinations),
+                    desc="Processing combinations",
+                    mininterval=1.0,
+                    miniters=max(1, len(parameter_combinations) // 200)
+                )):
+                    statistics[row] = result
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        return statistics
+
+    def get_statistics(self) -> tuple:
+        """
+        Returns the statistics of the last backtest in the field order of the statistics array.
+
+        Returns
+        -------
+        tuple
+            CAGR, average annual return, max drawdown, VaR, CVaR and annual volatility.
+        """
+        return (
+            self.results_models.cagr,
+            self.results_models.average_annual_return,
+            self.results_models.max_drawdown,
+            self.results_models.var,
+            self.results_models.cvar,
+            self.results_models.annual_volatility,
+        )
+
+    @staticmethod
+    def get_chunksize(num_combinations: int) -> int:
+        """
+        Number of combinations handed to a pool worker per task.
+
+        Sending the combinations in a few chunks per worker rather than one at a time keeps the
+        inter-process round trips off the backtests.
+
+        Parameters
+        ----------
+        num_combinations : int
+            Total number of parameter combinations to process.
+
+        Returns
+        -------
+        int
+            The chunk size to pass to ``ProcessPoolExecutor.map``.
         """
+        return max(1, num_combinations // (4 * (os.cpu_count() or 1)))
 
-    def plot_results(self, results: dict):
+    def plot_results(self, combinations: list, statistics: np.ndarray):
         """
         """
         results_process = ParameterTuningResultsProcessor(
             models_data=self.data_models,
             models_results=self.results_models,
-            results=results
+            combinations=combinations,
+            statistics=statistics
         )
         results_process.process()
@@ -4,3 +4,4 @@ Module to initialize processing_types.
 
 from strategy_analyzer.processing_types.models_types import Models
 from strategy_analyzer.processing_types.run_types import Runs
+from strategy_analyzer.processing_types.process_types import ProcessType
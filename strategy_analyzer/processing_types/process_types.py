@@ -0,0 +1,11 @@
+"""
+Module to create process types.
+"""
+
+from enum import IntEnum
+
+class ProcessType(IntEnum):
+    BACKTEST = 0
+    SIGNALS = 1
+    SIMULATION = 2
+    TUNE = 3
@@ -4,7 +4,6 @@ Processor for processing results from models.
 
 import numpy as np
 import pandas as pd
-import plotly.subplots as sp
 import plotly.graph_objects as go
 
 import strategy_analyzer.utilities as utilities
@@ -28,6 +27,9 @@ class BacktestResultsProcessor:
         """
         self.data_models = models_data
         self.results_models = models_results
+        is_dark = models_data.theme_mode.lower() == "dark"
+        self._line_color = "white" if is_dark else "black"
+        self._chart_theme = "plotly_dark" if is_dark else "plotly"
 
     def process(self):
         """
@@ -58,36 +60,25 @@ class BacktestResultsProcessor:
         portfolio_value = self.results_models.portfolio_values
         portfolio_final_value = portfolio_value.iloc[-1]
 
-        yearly_returns = self.results_models.portfolio_returns.copy()
-        yearly_returns = yearly_returns.resample('Y').apply(utilities.compound_returns)
-        yearly_returns_df = yearly_returns.to_frame(name='Yearly Return')
-        yearly_returns_df['Yearly Return'] *= 100  # Convert to percentage
-        yearly_returns_df['Year'] = yearly_returns_df.index.year
-        yearly_returns_df = yearly_returns_df.sort_values('Year')
+        yearly_returns = self._get_yearly_returns()
+        worst_year = yearly_returns.min()
+        best_year = yearly_returns.max()
 
-        worst_year = (yearly_returns_df["Yearly Return"]).min()
-        best_year  = (yearly_returns_df["Yearly Return"]).max()
-
-
-        if self.data_models.theme_mode.lower() == "dark":
-            line_color = "white"
-        else:
-            line_color = "black"
 
         fig = go.Figure()
 
         fig.add_trace(go.Scatter(
-            x=strategy_value.index,
-            y=strategy_value,
+            x=strategy_value.index.to_numpy(),
+            y=strategy_value.to_numpy(),
             mode='lines',
             name='Strategy Value',
-            line=dict(color=line_color)
+            line=dict(color=self._line_color)
         ))
 
         if self.results_models.buy_and_hold_values is not None:
             fig.add_trace(go.Scatter(
-                x=self.results_models.buy_and_hold_values.index,
-                y=self.results_models.buy_and_hold_values,
+                x=self.results_models.buy_and_hold_values.index.to_numpy(),
+                y=self.results_models.buy_and_hold_values.to_numpy(),
                 mode='lines',
                 name='Buy & Hold Value',
                 line=dict(color="#ce93d8")
@@ -95,20 +86,22 @@ class BacktestResultsProcessor:
 
         if self.results_models.benchmark_values is not None:
             fig.add_trace(go.Scatter(
-                x=self.results_models.benchmark_values.index,
-                y=self.results_models.benchmark_values,
+                x=self.results_models.benchmark_values.index.to_numpy(),
+                y=self.results_models.benchmark_values.to_numpy(),
                 mode='lines',
                 name='Benchmark Value',
                 line=dict(color="#9b4aa5")
             ))
 
-        fig.add_trace(go.Scatter(
-            x=self.results_models.portfolio_values.index,
-            y=self.results_models.portfolio_values,
-            mode='lines',
-            name='Portfolio Value',
-            line=dict(color="#9b4aa5")
-        ))
+        # Without contributions the portfolio line is the strategy line, so it is not drawn a second time.
+        if portfolio_value is not strategy_value and not portfolio_value.equals(strategy_value):
+            fig.add_trace(go.Scatter(
+                x=portfolio_value.index.to_numpy(),
+                y=portfolio_value.to_numpy(),
+                mode='lines',
+                name='Portfolio Value',
+                line=dict(color="#9b4aa5")
+            ))
 
         annotations = [
             dict(
@@ -177,22 +170,11 @@ class BacktestResultsProcessor:
             # TODO need to add actual portfolio statistics.
         ]
 
-        annotations.append(
-            dict(
-                xref='paper', yref='paper', x=0.5, y=0.2,
-                text="© Zephyr Analytics",
-                showarrow=False,
-                font=dict(size=80, color="#f8f9f9"),
-                xanchor='center',
-                yanchor='bottom',
-                opacity=0.5
-            )
-        )
+        annotations.append(utilities.LOGO_ANNOTATION)
 
-        chart_theme = "plotly_dark" if self.data_models.theme_mode.lower() == "dark" else "plotly"
 
         fig.update_layout(
-            template=chart_theme,
+            template=self._chart_theme,
             title=dict(
                 text=f'Portfolio Value: {self.data_models.weights_filename}',
                 x=0.5,
@@ -220,6 +202,14 @@ class BacktestResultsProcessor:
         )
 
 
+    def _get_yearly_returns(self) -> pd.Series:
+        """
+        Returns the compounded yearly portfolio returns in percent, indexed by year.
+        """
+        returns = self.results_models.portfolio_returns
+        return ((returns + 1).groupby(returns.index.year).prod() - 1) * 100
+
+
     def plot_var_cvar(self, confidence_level=0.95, filename='var_cvar'):
         """
         Plots the portfolio returns with VaR and CVaR and saves the plot as an HTML file.
@@ -232,17 +222,12 @@ class BacktestResultsProcessor:
             The name of the HTML file to save the plot. Default is 'var_cvar.html'.
         """
         # TODO this needs to use unadjusted returns.
-        returns = self.results_models.portfolio_returns
-
-        if self.data_models.theme_mode.lower() == "dark":
-            line_color = "white"
-        else:
-            line_color = "black"
+        returns = self.results_models.portfolio_returns.to_numpy()
 
         fig = go.Figure()
         fig.add_trace(
             go.Histogram(
-                x=returns.dropna(),
+                x=returns[~np.isnan(returns)],
                 nbinsx=30,
                 name='Returns',
                 opacity=0.75,
@@ -251,19 +236,18 @@ class BacktestResultsProcessor:
         )
         fig.add_shape(type="line",
                     x0=self.results_models.var, y0=0, x1=self.results_models.var, y1=1,
-                    line=dict(color=line_color, dash="dash"),
+                    line=dict(color=self._line_color, dash="dash"),
                     xref='x', yref='paper',
                     name=f'VaR ({confidence_level * 100}%): {self.results_models.var:.2%}')
         fig.add_shape(type="line",
                     x0=self.results_models.cvar, y0=0, x1=self.results_models.cvar, y1=1,
-                    line=dict(color=line_color, dash="dash"),
+                    line=dict(color=self._line_color, dash="dash"),
                     xref='x', yref='paper',
                     name=f'CVaR ({confidence_level * 100}%): {self.results_models.cvar:.2%}')
 
-        chart_theme = "plotly_dark" if self.data_models.theme_mode.lower() == "dark" else "plotly"
 
         fig.update_layout(
-            template=chart_theme,
+            template=self._chart_theme,
             title='Portfolio Returns with VaR and CVaR',
             xaxis_title='Returns',
             yaxis_title='Frequency',
@@ -306,15 +290,7 @@ class BacktestResultsProcessor:
                     text=f'CVaR ({confidence_level * 100}%): {self.results_models.cvar:.2%}',
                     showarrow=False
                 ),
-                dict(
-                    xref='paper', yref='paper', x=0.5, y=0.2,
-                    text="© Zephyr Analytics",
-                    showarrow=False,
-                    font=dict(size=80, color="#f8f9f9"),
-                    xanchor='center',
-                    yanchor='bottom',
-                    opacity=0.5
-                )
+                utilities.LOGO_ANNOTATION
             ]
         )
         utilities.save_html(
@@ -336,29 +312,22 @@ class BacktestResultsProcessor:
             The name of the file to save the plot. Default is 'returns_heatmap.html'.
         """
         # TODO this needs to use unadjusted returns.
-        monthly_returns = self.results_models.portfolio_returns.copy()
-        # monthly_returns.index = monthly_returns.index + pd.DateOffset(months=1)
-        monthly_returns_df = monthly_returns.to_frame(name='Monthly Return')
-        monthly_returns_df['Monthly Return'] *= 100
-        monthly_returns_df['Year'] = monthly_returns_df.index.year
-        monthly_returns_df['Month'] = monthly_returns_df.index.month
-
-        yearly_returns = self.results_models.portfolio_returns.copy()
-        yearly_returns = yearly_returns.resample('Y').apply(utilities.compound_returns)
-        yearly_returns_df = yearly_returns.to_frame(name='Yearly Return')
-        yearly_returns_df['Yearly Return'] *= 100  # Convert to percentage
-        yearly_returns_df['Year'] = yearly_returns_df.index.year
-        yearly_returns_df = yearly_returns_df.sort_values('Year')
-
-
-        monthly_heatmap_data = monthly_returns_df.pivot('Year', 'Month', 'Monthly Return')
-        monthly_heatmap_data = monthly_heatmap_data.reindex(columns=np.arange(1, 13))
-
-        all_returns = np.concatenate([
-            monthly_heatmap_data.values.flatten(),
-            yearly_returns_df['Yearly Return'].values
-        ])
-        zmin, zmax = np.nanmin(all_returns), np.nanmax(all_returns)
+        returns = self.results_models.portfolio_returns.dropna()
+        # The index is sorted, so each month is one contiguous run that reduceat sums in a single pass.
+        month_keys = (returns.index.year * 12 + returns.index.month - 1).to_numpy()
+        starts = np.flatnonzero(np.diff(month_keys, prepend=-1))
+        month_keys = month_keys[starts]
+        years, rows = np.unique(month_keys // 12, return_inverse=True)
+        monthly_values = np.full((years.size, 12), np.nan)
+        monthly_values[rows, month_keys % 12] = np.add.reduceat(returns.to_numpy(), starts) * 100
+
+        yearly_returns = self._get_yearly_returns()
+
+        yearly_values = yearly_returns.to_numpy()
+        zmin = min(np.nanmin(monthly_values), np.nanmin(yearly_values))
+        zmax = max(np.nanmax(monthly_values), np.nanmax(yearly_values))
+
+        import plotly.subplots as sp  # pylint: disable=import-outside-toplevel
 
         fig = sp.make_subplots(
             rows=2, cols=1,
@@ -368,10 +337,15 @@ class BacktestResultsProcessor:
             vertical_spacing=0.1
         )
 
+        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+        monthly_text = np.where(np.isnan(monthly_values), "", np.char.mod("%.2f%%", monthly_values))
         fig.add_trace(go.Heatmap(
-            z=monthly_heatmap_data.values,
-            x=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
-            y=monthly_heatmap_data.index,
+            z=monthly_values.round(2),
+            x=months,
+            y=years,
+            text=monthly_text,
+            texttemplate="%{text}",
+            textfont=dict(color="black"),
             colorscale=[
                 [0.0, 'red'],
                 [(0 - zmin) / (zmax - zmin), 'white'],
@@ -381,29 +355,13 @@ class BacktestResultsProcessor:
             zmax=zmax,
             showscale=False,
         ), row=1, col=1)
-        monthly_annotations = []
-        for i in range(monthly_heatmap_data.shape[0]):
-            for j in range(monthly_heatmap_data.shape[1]):
-                value = monthly_heatmap_data.iloc[i, j]
-                if not np.isnan(value):
-                    monthly_annotations.append(
-                        dict(
-                            text=f"{value:.2f}%",
-                            x=[
-                                'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'
-                            ][j],
-                            y=monthly_heatmap_data.index[i],
-                            xref='x1',
-                            yref='y1',
-                            font=dict(color="black"),
-                            showarrow=False
-                        )
-                    )
         fig.add_trace(go.Heatmap(
-            z=[yearly_returns_df['Yearly Return'].values],
-            x=yearly_returns_df['Year'],
+            z=[yearly_values.round(2)],
+            x=yearly_returns.index,
             y=["Yearly Returns"],
+            text=[np.char.mod("%.2f%%", yearly_values)],
+            texttemplate="%{text}",
+            textfont=dict(color="black"),
             colorscale=[
                 [0.0, 'red'],
                 [(0 - zmin) / (zmax - zmin), 'white'],
@@ -413,35 +371,11 @@ class BacktestResultsProcessor:
             zmax=zmax,
             showscale=False,
         ), row=2, col=1)
-        yearly_annotations = []
-        for i in range(yearly_returns_df.shape[0]):
-            value = yearly_returns_df['Yearly Return'].iloc[i]
-            yearly_annotations.append(
-                dict(
-                    text=f"{value:.2f}%",
-                    x=yearly_returns_df['Year'].iloc[i],
-                    y="Yearly Returns",
-                    xref='x2',
-                    yref='y2',
-                    font=dict(color="black"),
-                    showarrow=False
-                )
-            )
-
-        chart_theme = "plotly_dark" if self.data_models.theme_mode.lower() == "dark" else "plotly"
 
         fig.update_layout(
-            template=chart_theme,
-            annotations=monthly_annotations + yearly_annotations + [
-                dict(
-                    xref='paper', yref='paper', x=0.5, y=0.5,
-                    text="© Zephyr Analytics",
-                    showarrow=False,
-                    font=dict(size=80, color="#f8f9f9"),
-                    xanchor='center',
-                    yanchor='bottom',
-                    opacity=0.5
-                )
+            template=self._chart_theme,
+            annotations=[
+                dict(utilities.LOGO_ANNOTATION, y=0.5)
             ]
         )
 
@@ -7,10 +7,40 @@ class ModelsResults:
     """
     Getter and setter class for storing model results.
     """
+    __slots__ = (
+        "_buy_and_hold_values",
+        "_buy_and_hold_returns",
+        "_portfolio_values",
+        "_portfolio_returns",
+        "_cagr",
+        "_average_annual_return",
+        "_max_drawdown",
+        "_var",
+        "_cvar",
+        "_annual_volatility",
+        "_standard_deviation",
+        "_benchmark_asset",
+        "_benchmark_values",
+        "_benchmark_returns",
+        "_contribution",
+        "_contribution_frequency",
+        "_adjusted_weights",
+        "_latest_weights",
+        "_simulation_results",
+        "_taxed_returns",
+        "_portfolio_values_non_con",
+    )
+
     def __init__(self):
         """
         Initializes the Config class with default values for portfolio parameters.
         """
+        self.reset()
+
+    def reset(self):
+        """
+        Clears every result back to its default, so one instance can be reused across backtests.
+        """
         self._buy_and_hold_values = None
         self._buy_and_hold_returns = None
         self._portfolio_values = None
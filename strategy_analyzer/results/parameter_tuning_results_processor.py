@@ -2,8 +2,8 @@
 Processor for processing results from models.
 """
 
-import plotly.express as px
-import statsmodels.api as sm
+import numpy as np
+import pandas as pd
 
 import strategy_analyzer.utilities as utilities
 from strategy_analyzer.models.models_data import ModelsData
@@ -14,7 +14,9 @@ class ParameterTuningResultsProcessor:
     """
     A class to process and visualize the results of portfolio backtests and simulations.
     """
-    def __init__(self, models_data: ModelsData, models_results: ModelsResults, results: dict):
+    def __init__(
+        self, models_data: ModelsData, models_results: ModelsResults, combinations: list, statistics: np.ndarray
+    ):
         """
         Initializes the ResultsProcessor with the data from ModelsData.
 
@@ -23,57 +25,63 @@ class ParameterTuningResultsProcessor:
         data_models : ModelsData
             An instance of the ModelsData class containing all
             relevant parameters and data for processing results.
+        combinations : list
+            Parameter combinations from parameter tuning.
+        statistics : numpy.ndarray
+            Structured array of the statistics of each combination, row for row.
         """
         self.data_models = models_data
         self.results_models = models_results
-        self.results = results
+        self.combinations = combinations
+        self.statistics = statistics
+        self._chart_theme = "plotly_dark" if models_data.theme_mode.lower() == "dark" else "plotly"
 
     def process(self):
         """
         """
-        self.plot_parametertune_results(results=self.results)
+        self.plot_parametertune_results(combinations=self.combinations, statistics=self.statistics)
 
-    def plot_parametertune_results(self, results: dict, filename="parameter_tune"):
+    def plot_parametertune_results(self, combinations: list, statistics: np.ndarray, filename="parameter_tune"):
         """
         Plot results from strategy testing (Momentum or Moving Average).
 
         Parameters
         ----------
-        results : dict
-            Dictionary of results from parameter tuning.
+        combinations : list
+            Parameter combinations from parameter tuning.
+        statistics : numpy.ndarray
+            Structured array of the statistics of each combination, row for row.
         """
         if self.data_models.processing_type.startswith("MOMENTUM"):
             strategy_label = "Momentum_Strategy"
-            strategy_format = [
-                f"MA:{key[0]} Freq:{key[1]} Assets:{key[2]} Type:{key[3]}" for key in results.keys()
-            ]
+            strategy_format = list(map("MA:%s Freq:%s Assets:%s Type:%s".__mod__, combinations))
             title = f"Possible Momentum Strategies - {self.data_models.weights_filename}"
         elif self.data_models.processing_type.startswith("MA_CROSSOVER"):
             strategy_label = "Moving_Average_Crossover_Strategy"
-            strategy_format = [
-                f"MA:{key[0]} Fast:{key[1]} Slow: {key[2]} Freq:{key[3]} Type:{key[4]}" for key in results.keys()
-            ]
+            strategy_format = list(map("MA:%s Fast:%s Slow: %s Freq:%s Type:%s".__mod__, combinations))
             title = f"Possible Moving Average Strategies - {self.data_models.weights_filename}"
-        elif self.data_models.processing_type.startswith("MA"):
+        elif self.data_models.processing_type.startswith("MA_"):
             strategy_label = "Moving_Average_Strategy"
-            strategy_format = [
-                f"MA:{key[0]} Freq:{key[1]} Type:{key[2]}" for key in results.keys()
-            ]
+            strategy_format = list(map("MA:%s Freq:%s Type:%s".__mod__, combinations))
             title = f"Possible Moving Average Strategies - {self.data_models.weights_filename}"
-
-        data = {
-            strategy_label: strategy_format,
-            "cagr": [round(v["cagr"] * 100, 2) for v in results.values()],
-            "average_annual_return": [round(v["average_annual_return"] * 100, 2) for v in results.values()],
-            "annual_volatility": [round(v["annual_volatility"] * 100, 2) for v in results.values()],
-            "max_drawdown": [round(v["max_drawdown"] * 100, 2) for v in results.values()],
-            "var": [round(v["var"] * 100, 2) for v in results.values()],
-            "cvar": [round(v["cvar"] * 100, 2) for v in results.values()],
-            "sharpe_ratio": [
-                round(v["cagr"] / v["annual_volatility"], 2) if v["annual_volatility"] != 0 else None
-                for v in results.values()
-            ]
-        }
+        else:
+            strategy_label = "Strategy"
+            strategy_format = [" ".join(str(part) for part in key) for key in combinations]
+            title = f"Possible Strategies - {self.data_models.weights_filename}"
+
+        cagr = statistics["cagr"].astype(np.float64)
+        annual_volatility = statistics["annual_volatility"].astype(np.float64)
+        data = pd.DataFrame({
+            statistic: statistics[statistic]
+            for statistic in ("cagr", "average_annual_return", "annual_volatility", "max_drawdown", "var", "cvar")
+        }, dtype=np.float64).mul(100).round(2)
+        sharpe_ratio = np.full(len(cagr), np.nan)
+        np.divide(cagr, annual_volatility, out=sharpe_ratio, where=annual_volatility != 0)
+        data["sharpe_ratio"] = sharpe_ratio.round(2)
+        data.insert(0, strategy_label, strategy_format)
+
+        # plotly.express (and statsmodels behind its "ols" trendline) is only loaded once a tuning plot is drawn.
+        import plotly.express as px  # pylint: disable=import-outside-toplevel
 
         trimmed_twilight = px.colors.cyclical.Twilight[1:]
         fig = px.scatter(
@@ -97,8 +105,8 @@ class ParameterTuningResultsProcessor:
         )
 
         rf = 0.04
-        market_return = max(data["cagr"]) / 100
-        market_volatility = max(data["annual_volatility"]) / 100
+        market_return = data["cagr"].max() / 100
+        market_volatility = data["annual_volatility"].max() / 100
 
         slope = (market_return - rf) / market_volatility
 
@@ -127,21 +135,10 @@ class ParameterTuningResultsProcessor:
         #         )
         #     )
 
-        chart_theme = "plotly_dark" if self.data_models.theme_mode.lower() == "dark" else "plotly"
         fig.update_layout(
-            template=chart_theme,
+            template=self._chart_theme,
             coloraxis_colorbar_title="Sharpe Ratio",
-            annotations=[
-                dict(
-                    xref='paper', yref='paper', x=0.5, y=0.2,
-                    text="© Zephyr Analytics",
-                    showarrow=False,
-                    font=dict(size=80, color="#f8f9f9"),
-                    xanchor='center',
-                    yanchor='bottom',
-                    opacity=0.5
-                )
-            ]
+            annotations=[utilities.LOGO_ANNOTATION]
         )
 
         utilities.save_html(
@@ -79,17 +79,7 @@ class SignalsResultsProcessor:
             title_text=f"Portfolio Signals on {self.data_models.end_date}",
             height=600,
             margin=dict(t=50, b=50, l=50, r=50),
-            annotations=[
-                dict(
-                    xref='paper', yref='paper', x=0.5, y=0.1,
-                    text="© Zephyr Analytics",
-                    showarrow=False,
-                    font=dict(size=80, color="#f8f9f9"),
-                    xanchor='center',
-                    yanchor='bottom',
-                    opacity=0.5
-                )
-            ]
+            annotations=[dict(utilities.LOGO_ANNOTATION, y=0.1)]
         )
 
         utilities.save_html(
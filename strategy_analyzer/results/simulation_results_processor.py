@@ -3,7 +3,6 @@ Processor for processing results from models.
 """
 
 import numpy as np
-import pandas as pd
 import plotly.graph_objects as go
 
 import strategy_analyzer.utilities as utilities
@@ -52,16 +51,15 @@ class SimulationResultsProcessor:
         filename : str, optional
             The name of the HTML file to save the plot. Default is 'monte_carlo_simulation.html'.
         """
-        average_simulation = self.results_models.simulation_results.mean(axis=1)
-        print(average_simulation)
-        lower_bound = np.percentile(self.results_models.simulation_results, 5, axis=1)
-        upper_bound = np.percentile(self.results_models.simulation_results, 95, axis=1)
-        average_cagr = utilities.simulations_calculate_cagr(pd.Series(average_simulation))
-        lower_cagr = utilities.simulations_calculate_cagr(pd.Series(lower_bound))
-        upper_cagr = utilities.simulations_calculate_cagr(pd.Series(upper_bound))
-        average_end_value = pd.Series(average_simulation).iloc[-1]
-        lower_end_value = pd.Series(lower_bound).iloc[-1]
-        upper_end_value = pd.Series(upper_bound).iloc[-1]
+        simulation_results = np.asarray(self.results_models.simulation_results)
+        average_simulation = simulation_results.mean(axis=1)
+        lower_bound, upper_bound = np.percentile(simulation_results, [5, 95], axis=1)
+        average_cagr = utilities.simulations_calculate_cagr(average_simulation)
+        lower_cagr = utilities.simulations_calculate_cagr(lower_bound)
+        upper_cagr = utilities.simulations_calculate_cagr(upper_bound)
+        average_end_value = average_simulation[-1]
+        lower_end_value = lower_bound[-1]
+        upper_end_value = upper_bound[-1]
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=list(range(self.data_models.simulation_horizon + 1)),
@@ -91,19 +89,10 @@ class SimulationResultsProcessor:
             template=chart_theme,
             title=f'Simulation of {self.data_models.weights_filename}',
             xaxis_title='Year',
+            hovermode='x unified',
             yaxis_title='Portfolio Value ($)',
             legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            annotations=[
-                dict(
-                    xref='paper', yref='paper', x=0.5, y=0.2,
-                    text="© Zephyr Analytics",
-                    showarrow=False,
-                    font=dict(size=80, color="#f8f9f9"),
-                    xanchor='center',
-                    yanchor='bottom',
-                    opacity=0.5
-                )
-            ]
+            annotations=[utilities.LOGO_ANNOTATION]
         )
 
         utilities.save_html(
@@ -6,6 +6,24 @@ import numpy as np
 
 import pandas as pd
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for numba.njit that returns the function unchanged when numba is not installed.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+_MA_CACHE = {}
+_MA_CACHE_SIZE = 64
+
 
 def calculate_cagr(portfolio_value):
     """
@@ -13,19 +31,18 @@ def calculate_cagr(portfolio_value):
 
     Parameters
     ----------
-    portfolio_value : Series
-        Series containing the portfolio value over time.
+    portfolio_value : Series or ndarray
+        Portfolio value over time.
 
     Returns
     -------
     float
         CAGR value.
     """
-    total_months = len(portfolio_value) - 1
-
-    total_years = total_months / 12
+    values = np.asarray(portfolio_value, dtype=np.float64)
+    total_years = (len(values) - 1) / 12
 
-    cagr = (portfolio_value.iloc[-1] / portfolio_value.iloc[0]) ** (1 / total_years) - 1
+    cagr = (values[-1] / values[0]) ** (1 / total_years) - 1
 
     return cagr
 
@@ -36,17 +53,18 @@ def simulations_calculate_cagr(simulated_portfolio_value):
 
     Parameters
     ----------
-    simulated_portfolio_value : Series
-        Series containing the portfolio value over time.
+    simulated_portfolio_value : Series or ndarray
+        Yearly portfolio value over time.
 
     Returns
     -------
     float
         CAGR value.
     """
-    total_years = len(simulated_portfolio_value) - 1
+    values = np.asarray(simulated_portfolio_value, dtype=np.float64)
+    total_years = len(values) - 1
 
-    cagr = (simulated_portfolio_value.iloc[-1] / simulated_portfolio_value.iloc[0]) ** (1 / total_years) - 1
+    cagr = (values[-1] / values[0]) ** (1 / total_years) - 1
 
     return cagr
 
@@ -57,17 +75,15 @@ def calculate_average_annual_return(returns):
 
     Parameters
     ----------
-    returns : Series
-        Series containing the portfolio returns over time.
-    trading_frequency : str, optional
-        The frequency of trades. Either 'monthly' or 'bi-monthly'. Default is 'monthly'.
+    returns : Series or ndarray
+        Monthly portfolio returns over time. Missing returns are ignored.
 
     Returns
     -------
     float
         Average annual return.
     """
-    average_periodic_return = returns.mean()
+    average_periodic_return = np.nanmean(np.asarray(returns, dtype=np.float64))
     average_annual_return = (1 + average_periodic_return) ** 12 - 1
 
     return average_annual_return
@@ -79,19 +95,20 @@ def calculate_max_drawdown(portfolio_value):
 
     Parameters
     ----------
-    portfolio_value : Series
-        Series containing the portfolio value over time.
+    portfolio_value : Series or ndarray
+        Portfolio value over time.
 
     Returns
     -------
     float
         Maximum drawdown value.
     """
-    running_max = portfolio_value.cummax()
-    drawdown = (portfolio_value / running_max) - 1
-    max_drawdown = drawdown.min()
+    values = np.asarray(portfolio_value, dtype=np.float64)
 
-    return max_drawdown
+    if NUMBA_AVAILABLE:
+        return _max_drawdown_kernel(values)
+
+    return (values / np.maximum.accumulate(values) - 1).min()
 
 
 def calculate_var_cvar(returns, confidence_level=0.95):
@@ -100,8 +117,8 @@ def calculate_var_cvar(returns, confidence_level=0.95):
 
     Parameters
     ----------
-    returns : Series
-        Series containing the portfolio returns over time.
+    returns : Series or ndarray
+        Portfolio returns over time. Missing returns are ignored.
     confidence_level : float, optional
         The confidence level for calculating VaR and CVaR. Default is 0.95.
 
@@ -110,11 +127,14 @@ def calculate_var_cvar(returns, confidence_level=0.95):
     tuple
         Tuple containing VaR and CVaR values.
     """
-    sorted_returns = np.sort(returns.dropna())
-    index = int(np.floor((1 - confidence_level) * len(sorted_returns)))
-    index = max(0, min(index, len(sorted_returns) - 1))
-    var = sorted_returns[index]
-    cvar = sorted_returns[:index + 1].mean()
+    period_returns = np.asarray(returns, dtype=np.float64)
+    period_returns = period_returns[~np.isnan(period_returns)]
+    index = int(np.floor((1 - confidence_level) * len(period_returns)))
+    index = max(0, min(index, len(period_returns) - 1))
+    # Only the lowest index + 1 returns matter, so a linear-time partition replaces the full sort.
+    tail = np.partition(period_returns, index)[:index + 1]
+    var = tail[index]
+    cvar = tail.mean()
 
     return var, cvar
 
@@ -125,59 +145,473 @@ def calculate_annual_volatility(portfolio_returns):
 
     Parameters
     ----------
-    backtest : BacktestStaticPortfolio
-        An instance of BacktestStaticPortfolio with completed backtest.
+    portfolio_returns : Series or ndarray
+        Monthly portfolio returns over time. Missing returns are ignored.
 
     Returns
     -------
     float
         The annual volatility of the portfolio.
     """
-    annual_volatility = portfolio_returns.std() * np.sqrt(12)
+    annual_volatility = calculate_standard_deviation(portfolio_returns) * np.sqrt(12)
 
     return annual_volatility
 
 
-def calculate_standard_deviation(returns: pd.Series) -> FloatingPointError:
+def calculate_standard_deviation(returns: pd.Series) -> float:
     """
     Calculates the standard deviation of the portfolio returns.
 
     Parameters
     ----------
-    returns : Series
-        Series containing the portfolio returns over time.
+    returns : Series or ndarray
+        Portfolio returns over time. Missing returns are ignored.
 
     Returns
     -------
     float
         Standard deviation of returns.
     """
-    return returns.std()
+    period_returns = np.asarray(returns, dtype=np.float64)
+    period_returns = period_returns[~np.isnan(period_returns)]
+    if len(period_returns) < 2:
+        return np.nan
 
+    return period_returns.std(ddof=1)
 
-def is_below_ma(current_date, ticker, data, ma_type, ma_window):
+
+def calculate_portfolio_statistics(portfolio_value, returns, confidence_level=0.95):
     """
-    Checks if the price of the given ticker is below its moving average.
+    Calculates every backtest statistic from the monthly portfolio values and returns in one pass.
+
+    Matches calculate_cagr, calculate_average_annual_return, calculate_max_drawdown, calculate_var_cvar,
+    calculate_annual_volatility and calculate_standard_deviation.
 
     Parameters
     ----------
-    ticker : str
-        The ticker to check.
-    data : DataFrame
-        The DataFrame containing the ticker's data.
+    portfolio_value : Series or ndarray
+        Portfolio value over time.
+    returns : Series or ndarray
+        Portfolio returns over time. Missing returns are ignored.
+    confidence_level : float, optional
+        The confidence level for calculating VaR and CVaR. Default is 0.95.
+
+    Returns
+    -------
+    tuple
+        CAGR, average annual return, max drawdown, VaR, CVaR, annual volatility and standard deviation.
+    """
+    values = np.asarray(portfolio_value, dtype=np.float64)
+    period_returns = np.asarray(returns, dtype=np.float64)
+    period_returns = period_returns[~np.isnan(period_returns)]
+
+    if NUMBA_AVAILABLE:
+        return _portfolio_statistics_kernel(values, period_returns, confidence_level)
+
+    cagr = (values[-1] / values[0]) ** (12 / (len(values) - 1)) - 1
+    max_drawdown = (values / np.maximum.accumulate(values) - 1).min()
+
+    num_returns = len(period_returns)
+    average_return = period_returns.mean()
+    standard_deviation = period_returns.std(ddof=1) if num_returns > 1 else np.nan
+
+    index = max(0, min(int(np.floor((1 - confidence_level) * num_returns)), num_returns - 1))
+    tail = np.partition(period_returns, index)[:index + 1]
+
+    return (
+        cagr,
+        (1 + average_return) ** 12 - 1,
+        max_drawdown,
+        tail[index],
+        tail.mean(),
+        standard_deviation * np.sqrt(12),
+        standard_deviation,
+    )
+
+
+@njit(cache=True)
+def _portfolio_statistics_kernel(values, returns, confidence_level):
+    cagr = (values[-1] / values[0]) ** (12.0 / (values.shape[0] - 1)) - 1.0
+    max_drawdown = _max_drawdown_kernel(values)
+
+    num_returns = returns.shape[0]
+    average_return = returns.sum() / num_returns
+    standard_deviation = np.nan
+    if num_returns > 1:
+        squares = 0.0
+        for i in range(num_returns):
+            squares += (returns[i] - average_return) ** 2
+        standard_deviation = np.sqrt(squares / (num_returns - 1))
+
+    index = max(0, min(int(np.floor((1.0 - confidence_level) * num_returns)), num_returns - 1))
+    tail = np.partition(returns, index)[:index + 1]
+
+    return (
+        cagr,
+        (1.0 + average_return) ** 12 - 1.0,
+        max_drawdown,
+        tail[index],
+        tail.mean(),
+        standard_deviation * np.sqrt(12.0),
+        standard_deviation,
+    )
+
+
+@njit(cache=True)
+def _max_drawdown_kernel(values):
+    running_max = values[0]
+    max_drawdown = 0.0
+    for i in range(values.shape[0]):
+        if values[i] > running_max:
+            running_max = values[i]
+        drawdown = values[i] / running_max - 1.0
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+    return max_drawdown
+
+
+def select_top_assets(momentum, num_assets):
+    """
+    Selects the assets with the highest momentum.
+
+    Parameters
+    ----------
+    momentum : Series
+        Series of momentum values indexed by ticker.
+    num_assets : int
+        Number of assets to select.
+
+    Returns
+    -------
+    Series
+        Momentum of the selected assets, sorted from highest to lowest.
+    """
+    values = momentum.to_numpy()
+    missing = np.isnan(values)
+    candidates = np.flatnonzero(~missing)
+    num_assets = max(num_assets, 0)
+
+    if num_assets < len(candidates):
+        candidate_values = values[candidates]
+        cutoff = -np.partition(-candidate_values, num_assets - 1)[num_assets - 1]
+        above = candidates[candidate_values > cutoff]
+        ties = candidates[candidate_values == cutoff][:num_assets - len(above)]
+        candidates = np.sort(np.concatenate([above, ties]))
+
+    selected = np.concatenate([
+        candidates[np.argsort(-values[candidates], kind="stable")],
+        np.flatnonzero(missing)
+    ])[:num_assets]
+
+    return momentum.iloc[selected]
+
+
+def is_below_ma(below, row, col):
+    """
+    Checks if a price is below its moving average using a precomputed below-MA matrix.
+
+    Parameters
+    ----------
+    below : ndarray
+        Boolean matrix of prices below their moving average.
+    row : int
+        Row of the current date.
+    col : int
+        Column of the ticker.
 
     Returns
     -------
     bool
         True if the price is below the moving average, False otherwise.
     """
-    price = data.loc[:current_date, ticker].iloc[-1]
+    return bool(below[row, col])
 
-    if ma_type == "SMA":
-        ma = data.loc[:current_date, ticker].rolling(window=ma_window).mean().iloc[-1]
-    elif ma_type == "EMA":
-        ma = data.loc[:current_date, ticker].ewm(span=ma_window).mean().iloc[-1]
+
+def pick_replacement_asset(bond_ticker, bond_above_ma, cash_ticker):
+    """
+    Selects the asset receiving the weight of replaced assets.
+
+    Parameters
+    ----------
+    bond_ticker : str
+        The bond ticker, empty if no bond is configured.
+    bond_above_ma : bool
+        Whether the bond has data and trades at or above its moving average.
+    cash_ticker : str
+        The cash ticker.
+
+    Returns
+    -------
+    str
+        The bond ticker if it is above its moving average, otherwise the cash ticker.
+    """
+    return bond_ticker if bond_ticker and bond_above_ma else cash_ticker
+
+
+def apply_ma_replacement(replace_row, asset_cols, weights, replacement_idx):
+    """
+    Moves the weight of every flagged asset into the replacement asset and normalizes the result.
+
+    Parameters
+    ----------
+    replace_row : ndarray
+        Boolean flags of the asset universe on the current date, True where the asset is replaced.
+    asset_cols : ndarray
+        Column of each weighted asset in replace_row, -1 for assets without price data.
+    weights : ndarray
+        Weights aligned to asset_cols, with an optional trailing slot for the replacement asset.
+    replacement_idx : int
+        Position of the replacement asset in weights, -1 if there is no replacement asset.
+
+    Returns
+    -------
+    tuple
+        The normalized weights and whether any asset was replaced.
+    """
+    if NUMBA_AVAILABLE:
+        return _adjust_weights_kernel(replace_row, asset_cols, weights, replacement_idx)
+
+    num_assets = len(asset_cols)
+    replaced = np.zeros(num_assets, dtype=bool)
+    if replacement_idx >= 0:
+        has_data = asset_cols >= 0
+        replaced[has_data] = replace_row[asset_cols[has_data]]
+
+    if not replaced.any():
+        out = weights.copy()
     else:
-        raise ValueError("Invalid ma_type. Choose 'SMA' or 'EMA'.")
+        targets = np.arange(len(weights), dtype=np.int32)
+        targets[:num_assets][replaced] = replacement_idx
+        contributions = weights.copy()
+        if replacement_idx < num_assets and replaced[replacement_idx]:
+            # Zeroing the replacement slot also drops the weight moved into it by earlier assets.
+            contributions[:replacement_idx + 1][replaced[:replacement_idx + 1]] = 0.0
+        out = np.zeros_like(weights)
+        np.add.at(out, targets, contributions)
+
+    total = out.sum()
+    if total > 0:
+        np.multiply(out, 1.0 / total, out)
+
+    return out, bool(replaced.any())
+
+
+@njit(cache=True)
+def _adjust_weights_kernel(replace_row, asset_cols, weights, replacement_idx):
+    out = weights.copy()
+    replaced = False
+    if replacement_idx >= 0:
+        for i in range(asset_cols.shape[0]):
+            col = asset_cols[i]
+            if col >= 0 and replace_row[col]:
+                out[replacement_idx] += weights[i]
+                out[i] = 0.0
+                replaced = True
+
+    total = out.sum()
+    if total > 0:
+        np.multiply(out, 1.0 / total, out)
+
+    return out, replaced
+
+
+def moving_average(values, period, ma_type):
+    """
+    Calculates the moving average of every column of a price array.
+
+    Parameters
+    ----------
+    values : ndarray
+        Two-dimensional array of prices, one column per asset.
+    period : int
+        The period for calculating the moving average.
+    ma_type : str
+        Either 'SMA' or 'EMA'.
+
+    Returns
+    -------
+    ndarray
+        The moving average values, NaN where the window is not yet filled.
+    """
+    return get_moving_average_function(ma_type)(values, period)
+
+
+def precompute_ma(data, ma_type, window):
+    """
+    Returns the moving average of every column of data, computed once per frame, type and window.
+
+    Parameters
+    ----------
+    data : DataFrame
+        The DataFrame containing price data.
+    ma_type : str
+        Either 'SMA' or 'EMA'.
+    window : int
+        The period for calculating the moving average.
+
+    Returns
+    -------
+    ndarray
+        The float32 moving average values, aligned to the rows and columns of data.
+    """
+    key = (id(data), ma_type, window)
+    cached = _MA_CACHE.get(key)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+
+    result = moving_average(values=data.to_numpy(), period=window, ma_type=ma_type).astype(np.float32)
+    if len(_MA_CACHE) >= _MA_CACHE_SIZE:
+        del _MA_CACHE[next(iter(_MA_CACHE))]
+    _MA_CACHE[key] = (data, result)
+
+    return result
+
 
-    return price < ma
+def get_moving_average_function(ma_type):
+    """
+    Returns the moving average function for the given type.
+
+    Parameters
+    ----------
+    ma_type : str
+        Either 'SMA' or 'EMA'.
+
+    Returns
+    -------
+    callable
+        Function taking a price array and a period and returning the moving average array.
+    """
+    if ma_type == "SMA":
+        return simple_moving_average
+    if ma_type == "EMA":
+        return exponential_moving_average
+
+    raise ValueError("Invalid ma_type. Choose 'SMA' or 'EMA'.")
+
+
+def simple_moving_average(values, period):
+    """
+    Calculates the simple moving average of every column of a price array.
+
+    Parameters
+    ----------
+    values : ndarray
+        Two-dimensional array of prices, one column per asset.
+    period : int
+        The period for calculating the moving average.
+
+    Returns
+    -------
+    ndarray
+        The moving average values, NaN where the window is not yet filled.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _sma_recursive(values, int(period))
+
+    return pd.DataFrame(values).rolling(window=period).mean().to_numpy()
+
+
+def exponential_moving_average(values, period):
+    """
+    Calculates the exponential moving average of every column of a price array.
+
+    Parameters
+    ----------
+    values : ndarray
+        Two-dimensional array of prices, one column per asset.
+    period : int
+        The span of the moving average.
+
+    Returns
+    -------
+    ndarray
+        The moving average values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _ema_recursive(values, 2.0 / (period + 1.0))
+
+    return pd.DataFrame(values).ewm(span=period).mean().to_numpy()
+
+
+@njit(cache=True)
+def _sma_recursive(values, period):
+    rows, cols = values.shape
+    out = np.full((rows, cols), np.nan)
+    for col in range(cols):
+        total = 0.0
+        count = 0
+        for row in range(rows):
+            value = values[row, col]
+            if not np.isnan(value):
+                total += value
+                count += 1
+            if row >= period:
+                dropped = values[row - period, col]
+                if not np.isnan(dropped):
+                    total -= dropped
+                    count -= 1
+            if count == period:
+                out[row, col] = total / period
+
+    return out
+
+
+@njit(cache=True)
+def _ema_recursive(values, alpha):
+    rows, cols = values.shape
+    out = np.full((rows, cols), np.nan)
+    decay = 1.0 - alpha
+    for col in range(cols):
+        average = np.nan
+        old_weight = 1.0
+        for row in range(rows):
+            value = values[row, col]
+            if np.isnan(average):
+                average = value
+            else:
+                old_weight *= decay
+                if not np.isnan(value):
+                    average = (old_weight * average + value) / (old_weight + 1.0)
+                    old_weight += 1.0
+            out[row, col] = average
+
+    return out
+
+
+def simulate_portfolio_paths(initial_value, average_return, volatility, contribution, shocks, out):
+    """
+    Fills out with simulated portfolio values, compounding one normal annual return per year and path.
+
+    Parameters
+    ----------
+    initial_value : float
+        Starting value of every path.
+    average_return : float
+        Mean of the annual returns.
+    volatility : float
+        Standard deviation of the annual returns.
+    contribution : float
+        Amount added to every path at the end of each year.
+    shocks : ndarray
+        horizon x simulations array of standard normal draws, one per year and path. Drawing them from the
+        caller's Generator keeps seeded simulations reproducible.
+    out : ndarray
+        C-contiguous (horizon + 1) x simulations array receiving the portfolio values.
+    """
+    _simulate_core(
+        float(initial_value), float(average_return), float(volatility), float(contribution), shocks, out
+    )
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _simulate_core(initial_value, average_return, volatility, contribution, shocks, out):
+    horizon = out.shape[0] - 1
+    for path in prange(out.shape[1]):
+        value = initial_value
+        out[0, path] = value
+        for year in range(1, horizon + 1):
+            value = value * (1.0 + average_return + volatility * shocks[year - 1, path]) + contribution
+            out[year, path] = value
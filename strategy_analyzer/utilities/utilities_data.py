@@ -11,6 +11,18 @@ import pandas as pd
 import yfinance as yf
 import requests
 
+try:
+    import pyarrow  # pylint: disable=unused-import
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# The pyarrow CSV reader parses columns and ISO dates in C across threads; the default engine is the fallback.
+_CSV_ENGINE = "pyarrow" if PYARROW_AVAILABLE else "c"
+
+_FETCH_CACHE = {}
+_FETCH_CACHE_SIZE = 32
+
 
 def fetch_data(all_tickers, start_date=None, end_date=None):
     """
@@ -34,6 +46,12 @@ def fetch_data(all_tickers, start_date=None, end_date=None):
     DataFrame
         Adjusted closing prices of the assets.
     """
+    # Without an end date the download runs up to today, so its result goes stale and is not cached.
+    key = (tuple(sorted(all_tickers)), start_date, end_date) if end_date is not None else None
+    cached = _FETCH_CACHE.get(key)
+    if cached is not None:
+        return cached.copy()
+
     session = requests.Session()
 
     if start_date and end_date is None:
@@ -44,6 +62,11 @@ def fetch_data(all_tickers, start_date=None, end_date=None):
         )['Adj Close']
     session.close()
 
+    if key is not None:
+        if len(_FETCH_CACHE) >= _FETCH_CACHE_SIZE:
+            del _FETCH_CACHE[next(iter(_FETCH_CACHE))]
+        _FETCH_CACHE[key] = data.copy()
+
     return data
 
 
@@ -75,7 +98,7 @@ def load_raw_data_file(filename) -> pd.DataFrame:
         String representing the portfolio name.
     """
     file_path = os.path.join(os.getcwd(), "artifacts", f"{filename}", "raw_data", f"{filename}.csv")
-    df = pd.read_csv(file_path, index_col=0, parse_dates=True)
+    df = pd.read_csv(file_path, index_col=0, parse_dates=[0], engine=_CSV_ENGINE)
 
     return df
 
@@ -94,7 +117,7 @@ def read_data(file_path: str):
     Dataframe
         Dataframe of data used for model creation.
     """
-    df = pd.read_csv(file_path, index_col=0, parse_dates=True)
+    df = pd.read_csv(file_path, index_col=0, parse_dates=[0], engine=_CSV_ENGINE)
     return df
 
 
@@ -6,6 +6,18 @@ import os
 
 from datetime import datetime
 
+# Watermark shared by every chart; plotly copies it on assignment, so one dict serves all figures.
+LOGO_ANNOTATION = dict(
+    xref='paper', yref='paper', x=0.5, y=0.2,
+    text="© Zephyr Analytics",
+    showarrow=False,
+    font=dict(size=80, color="#f8f9f9"),
+    xanchor='center',
+    yanchor='bottom',
+    opacity=0.5
+)
+
+
 def save_html(fig, filename, weights_filename, processing_type):
     """
     Save the HTML file to the 'artifacts' directory within the current working directory.
@@ -28,7 +40,9 @@ def save_html(fig, filename, weights_filename, processing_type):
     os.makedirs(artifacts_directory, exist_ok=True)
 
     file_path = os.path.join(artifacts_directory, f"{timestamp}_{filename}.html")
-    fig.write_html(file_path)
+    # Figures are built from validated graph objects, so the schema walk on write is skipped, and plotly.js is
+    # loaded from the CDN instead of being inlined into every artifact.
+    fig.write_html(file_path, include_plotlyjs="cdn", validate=False)
 
 
 def compound_returns(returns):
@@ -103,3 +103,29 @@ def calculate_conditional_value_at_risk_weighting(
     adjusted_weights = validate_and_adjust_weights(adjusted_weights)
 
     return adjusted_weights
+
+
+def normalize_weights(weights, total=None):
+    """
+    Scale asset weights so they sum to 1.
+
+    Parameters
+    ----------
+    weights : dict
+        Dictionary of asset weights with asset names as keys and weights as values.
+    total : float, optional
+        Divisor to scale by. Defaults to the sum of the weights.
+
+    Returns
+    -------
+    dict
+        Normalized weights. An allocation that sums to zero maps every asset to 0.
+    """
+    tickers = list(weights)
+    values = np.fromiter(weights.values(), dtype=np.float64, count=len(tickers))
+    if total is None:
+        total = values.sum()
+    values *= (1.0 / total) if total else 0.0
+    np.nan_to_num(values, copy=False)
+
+    return dict(zip(tickers, values.tolist()))
@@ -0,0 +1,103 @@
+"""
+Tests for the batched weight adjustment of the moving average backtest processor.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("yfinance")
+pytest.importorskip("plotly")
+
+from strategy_analyzer.models.backtest_models.moving_average_backtest_processor import (
+    MovingAverageBacktestProcessor,
+)
+
+
+def _prices():
+    """
+    Builds daily prices that cross their moving averages at different times, so that assets, the bond and
+    the threshold asset fall below and climb back above their moving averages throughout the period.
+    """
+    index = pd.date_range("2020-01-01", periods=240, name="Date")
+    t = np.arange(len(index))
+    phases = {"SPY": 0.0, "QQQ": 1.5, "GLD": 3.0, "TLT": 4.5, "SHV": 2.2, "VTI": 5.1}
+
+    return pd.DataFrame(
+        {ticker: 100.0 + 10.0 * np.sin(t / 9.0 + phase) + 0.05 * t for ticker, phase in phases.items()},
+        index=index,
+    )
+
+
+def _make_processor(assets_weights, bond_ticker, cash_ticker, ma_threshold_asset="", ma_type="SMA"):
+    prices = _prices()
+    models_data = SimpleNamespace(
+        assets_weights=assets_weights,
+        bond_ticker=bond_ticker,
+        cash_ticker=cash_ticker,
+        ma_threshold_asset=ma_threshold_asset,
+        ma_window=21,
+        ma_type=ma_type,
+    )
+    portfolio_data = SimpleNamespace(
+        assets_data=prices[[ticker for ticker in assets_weights if ticker in prices]],
+        bond_data=prices[["TLT"]],
+        cash_data=prices[["SHV"]],
+        ma_threshold_data=prices[["VTI"]],
+    )
+
+    return MovingAverageBacktestProcessor(
+        models_data=models_data, portfolio_data=portfolio_data, models_results=None
+    )
+
+
+@pytest.mark.parametrize(
+    "assets_weights, bond_ticker, cash_ticker, ma_threshold_asset",
+    [
+        pytest.param({"SPY": 0.5, "QQQ": 0.3, "GLD": 0.2}, "TLT", "SHV", "", id="replacement-not-held"),
+        pytest.param({"SPY": 0.4, "TLT": 0.3, "QQQ": 0.3}, "TLT", "SHV", "", id="bond-replacement-held"),
+        pytest.param({"SPY": 0.4, "SHV": 0.3, "QQQ": 0.3}, "", "SHV", "", id="cash-replacement-held"),
+        pytest.param({"SHV": 0.2, "SPY": 0.5, "QQQ": 0.3}, "", "SHV", "", id="held-replacement-first"),
+        pytest.param({"SPY": 0.5, "QQQ": 0.3, "GLD": 0.2}, "", "", "", id="no-replacement"),
+        pytest.param({"SPY": 0.6, "QQQ": 0.2, "XYZ": 0.2}, "TLT", "SHV", "", id="asset-without-data"),
+        pytest.param({"SPY": 0.5, "QQQ": 0.3, "GLD": 0.2}, "TLT", "SHV", "VTI", id="threshold"),
+        pytest.param({"SPY": 0.5, "QQQ": 0.3, "GLD": 0.2}, "", "", "VTI", id="threshold-no-replacement"),
+    ],
+)
+def test_vectorized_adjust_weights_all_matches_adjust_weights(
+        assets_weights, bond_ticker, cash_ticker, ma_threshold_asset
+):
+    rebalance_dates = list(_prices().index[::5])
+    batched = _make_processor(assets_weights, bond_ticker, cash_ticker, ma_threshold_asset)
+    per_date = _make_processor(assets_weights, bond_ticker, cash_ticker, ma_threshold_asset)
+
+    batched_weights = batched.vectorized_adjust_weights_all(rebalance_dates)
+    per_date_weights = [per_date.adjust_weights(current_date=date) for date in rebalance_dates]
+
+    assert len(batched_weights) == len(rebalance_dates)
+    for date, expected, actual in zip(rebalance_dates, per_date_weights, batched_weights):
+        assert list(actual) == list(expected), date
+        np.testing.assert_allclose(list(actual.values()), list(expected.values()), err_msg=str(date))
+
+
+def test_vectorized_adjust_weights_all_without_replacement_keeps_weights():
+    assets_weights = {"SPY": 0.5, "QQQ": 0.3, "GLD": 0.2}
+    rebalance_dates = list(_prices().index[::5])
+    processor = _make_processor(assets_weights, bond_ticker="", cash_ticker="")
+
+    for weights in processor.vectorized_adjust_weights_all(rebalance_dates):
+        assert weights == pytest.approx(assets_weights)
+
+
+def test_precompute_weights_fills_every_rebalance_date():
+    rebalance_dates = list(_prices().index[::5])
+    processor = _make_processor({"SPY": 0.4, "TLT": 0.3, "QQQ": 0.3}, bond_ticker="TLT", cash_ticker="SHV")
+
+    processor.precompute_weights(rebalance_dates=rebalance_dates)
+
+    for date in rebalance_dates:
+        assert processor.get_portfolio_assets_and_weights(current_date=date) == pytest.approx(
+            processor.adjust_weights(current_date=date)
+        )
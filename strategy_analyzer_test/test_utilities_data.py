@@ -0,0 +1,51 @@
+"""
+Tests for the raw data readers in utilities_data.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import strategy_analyzer.utilities.utilities_data as utilities_data
+
+
+def _write_prices(file_path):
+    """
+    Writes a small daily price file with a date-only index and a missing value, as the raw data files have.
+    """
+    prices = pd.DataFrame(
+        {"SPY": np.linspace(100.0, 104.0, 5), "TLT": [90.0, np.nan, 91.0, 92.0, 93.0]},
+        index=pd.date_range("2020-01-01", periods=5, name="Date"),
+    )
+    prices.to_csv(file_path)
+
+    return prices
+
+
+def test_read_data_pyarrow_engine_returns_datetime_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(utilities_data, "_CSV_ENGINE", "pyarrow")
+    file_path = tmp_path / "prices.csv"
+    prices = _write_prices(file_path)
+
+    df = utilities_data.read_data(str(file_path))
+
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index.equals(prices.index)
+    np.testing.assert_allclose(df.to_numpy(), prices.to_numpy())
+
+
+def test_load_raw_data_file_pyarrow_engine_returns_datetime_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(utilities_data, "_CSV_ENGINE", "pyarrow")
+    monkeypatch.chdir(tmp_path)
+    raw_directory = os.path.join("artifacts", "portfolio", "raw_data")
+    os.makedirs(raw_directory)
+    prices = _write_prices(os.path.join(raw_directory, "portfolio.csv"))
+
+    df = utilities_data.load_raw_data_file("portfolio")
+
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.loc["2020-01-03", "SPY"] == prices.loc["2020-01-03", "SPY"]